@@ -1,22 +1,245 @@
 import os
-from dotenv import load_dotenv
-
-# Load environment variables from .env file
-load_dotenv()
-
-# Substack credentials - loaded from environment variables
-EMAIL = os.getenv("EMAIL")
-PASSWORD = os.getenv("PASSWORD")
-
-# Validate that required environment variables are set
-if not EMAIL:
-    raise ValueError("EMAIL environment variable is not set")
-if not PASSWORD:
-    raise ValueError("PASSWORD environment variable is not set")
-
-# Remote server configuration - loaded from environment variables
-REMOTE_SERVER = os.getenv("REMOTE_SERVER", "192.168.104.209")
-REMOTE_USER = os.getenv("REMOTE_USER", "ubuntu")
-REMOTE_BASE_DIR = os.getenv("REMOTE_BASE_DIR", "/home/ubuntu/substacks")
-REMOTE_HTML_DIR = os.getenv("REMOTE_HTML_DIR", "/home/ubuntu/substacks/html")
-SSH_KEY_PATH = os.getenv("SSH_KEY_PATH", "~/.ssh/id_ed25519")
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Final, Optional, Tuple
+
+__all__ = [
+    "Settings",
+    "get_settings",
+    "require_credentials",
+    "refresh_env",
+    # EMAIL and PASSWORD are left out so `from config import *` works without credentials
+    "REMOTE_SERVER",
+    "REMOTE_USER",
+    "REMOTE_BASE_DIR",
+    "REMOTE_HTML_DIR",
+    "SSH_KEY_PATH",
+]
+
+# Configuration variables and the defaults used when they are not set, walked once by get_settings()
+_DEFAULTS: Final[Tuple[Tuple[str, Optional[str]], ...]] = (
+    ("EMAIL", None),
+    ("PASSWORD", None),
+    ("REMOTE_SERVER", "192.168.104.209"),
+    ("REMOTE_USER", "ubuntu"),
+    ("REMOTE_BASE_DIR", "/home/ubuntu/substacks"),
+    ("SSH_KEY_PATH", "~/.ssh/id_ed25519"),
+)
+
+# Public configuration names, including REMOTE_HTML_DIR which is derived from REMOTE_BASE_DIR unless set
+_SETTING_NAMES: Final[Tuple[str, ...]] = (
+    "EMAIL", "PASSWORD", "REMOTE_SERVER", "REMOTE_USER", "REMOTE_BASE_DIR", "REMOTE_HTML_DIR", "SSH_KEY_PATH"
+)
+
+# Bound once so lookups skip the os.getenv wrapper and the module attribute load
+_env = os.environ
+
+# The .env file sits next to this module, so it is found regardless of the working directory
+_ENV_PATH: Final[str] = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".env")
+
+# When these are already set in the real environment (CI, containers), .env is not read at all
+_REQUIRED: Final[Tuple[str, ...]] = ("EMAIL", "PASSWORD")
+
+# Set to 1 to never read .env, e.g. in container deployments
+_SKIP_DOTENV_VAR: Final[str] = "SUBSTACK2MD_SKIP_DOTENV"
+
+# .env files at least this large are scanned through mmap instead of line by line
+_MMAP_MIN_SIZE: Final[int] = 4096
+
+# mmap is imported inside the function that needs it, so importing config stays cheap
+# when .env is skipped (real environment, SUBSTACK2MD_SKIP_DOTENV or config_frozen.py)
+
+_LOADED = False
+
+# Plain-dict copy of os.environ taken once .env is loaded, so settings lookups skip os._Environ's key encoding
+_snapshot: Dict[str, str] = {}
+
+
+@dataclass(frozen=True, repr=False)
+class Settings:
+    """
+    Immutable snapshot of the configuration, built once per process by get_settings()
+    """
+    __slots__ = (
+        "EMAIL", "PASSWORD", "REMOTE_SERVER", "REMOTE_USER", "REMOTE_BASE_DIR", "REMOTE_HTML_DIR_OVERRIDE",
+        "SSH_KEY_PATH"
+    )
+
+    EMAIL: Optional[str]
+    PASSWORD: Optional[str]
+    REMOTE_SERVER: str
+    REMOTE_USER: str
+    REMOTE_BASE_DIR: str
+    REMOTE_HTML_DIR_OVERRIDE: Optional[str]  # Explicit REMOTE_HTML_DIR, if set
+    SSH_KEY_PATH: str  # Absolute path, already expanded
+
+    @property
+    def REMOTE_HTML_DIR(self) -> str:
+        return self.REMOTE_HTML_DIR_OVERRIDE or f"{self.REMOTE_BASE_DIR}/html"
+
+    def __repr__(self) -> str:
+        # Never echo the password into logs or tracebacks
+        values = ", ".join(
+            f"{name}={'***' if name == 'PASSWORD' and self.PASSWORD else repr(getattr(self, name))}"
+            for name in _SETTING_NAMES
+        )
+        return f"{type(self).__name__}({values})"
+
+
+def _parse_env_line(line: str) -> Optional[Tuple[str, str]]:
+    """
+    Split one KEY=VALUE line, returning None for blanks, comments and lines without '='
+    """
+    line = line.strip()
+    if not line or line.startswith("#"):
+        return None
+
+    key, sep, value = line.partition("=")
+    if not sep:
+        return None
+
+    value = value.strip()
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in ('"', "'"):
+        value = value[1:-1]
+    return key.strip(), value
+
+
+def _parse_env_mmap(path: str) -> Dict[str, str]:
+    """
+    Parse a large .env file by scanning a memory map for newlines, decoding only the non-comment lines
+    """
+    import mmap
+
+    values = {}
+    with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        size = len(mm)
+        start = 0
+        while start < size:
+            end = mm.find(b"\n", start)
+            if end == -1:
+                end = size
+            line = mm[start:end].strip()
+            start = end + 1
+            if not line or line.startswith(b"#"):
+                continue
+
+            parsed = _parse_env_line(line.decode("utf-8"))
+            if parsed:
+                values[parsed[0]] = parsed[1]
+    return values
+
+
+def _parse_env(path: str, size: int) -> Dict[str, str]:
+    """
+    Parse KEY=VALUE lines from a .env file, skipping blanks and comments and stripping surrounding quotes
+    """
+    if size >= _MMAP_MIN_SIZE:
+        return _parse_env_mmap(path)
+
+    values = {}
+    with open(path, "r", encoding="utf-8") as file:
+        for line in file:
+            parsed = _parse_env_line(line)
+            if parsed:
+                values[parsed[0]] = parsed[1]
+    return values
+
+
+def _load_env_file(path: str = _ENV_PATH) -> None:
+    """
+    Load a .env file into os.environ without overriding variables that are already set
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return
+
+    for name, value in _parse_env(path, st.st_size).items():
+        _env.setdefault(name, value)
+
+
+def _load_frozen_settings() -> bool:
+    """
+    Apply values from config_frozen.py (generated by tools/freeze_config.py) if it exists. Returns True if it did.
+    """
+    try:
+        import config_frozen  # type: ignore
+    except ImportError:
+        return False
+
+    for name in _SETTING_NAMES:
+        value = getattr(config_frozen, name, None)
+        if value is not None:
+            _env.setdefault(name, value)
+    return True
+
+
+def _ensure_loaded() -> None:
+    """
+    Load environment variables from config_frozen.py or the .env file, at most once per process
+    """
+    global _LOADED, _snapshot
+    if _LOADED:
+        return
+    _LOADED = True
+
+    # config_frozen.py replaces .env; credentials already in the environment or SUBSTACK2MD_SKIP_DOTENV=1 skip it
+    skip_env_file = (
+        _load_frozen_settings()
+        or _env.get(_SKIP_DOTENV_VAR) == "1"
+        or all(name in _env for name in _REQUIRED)
+    )
+    if not skip_env_file:
+        _load_env_file()
+    _snapshot = dict(_env)
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Build the Settings instance from the environment on first call and return the same instance afterwards
+    """
+    _ensure_loaded()
+    values = {name: _snapshot.get(name, default) for name, default in _DEFAULTS}
+    values["REMOTE_HTML_DIR_OVERRIDE"] = _snapshot.get("REMOTE_HTML_DIR") or None
+    # Resolve ~ and symlinks once so SSH/SCP calls can use the key path as-is
+    values["SSH_KEY_PATH"] = os.path.realpath(os.path.expanduser(values["SSH_KEY_PATH"]))
+    # Intern so equal values (and their uses as dict keys downstream) share one string object
+    return Settings(**{name: sys.intern(value) if isinstance(value, str) else value for name, value in values.items()})
+
+
+def refresh_env() -> Settings:
+    """
+    Re-snapshot os.environ and rebuild the settings, for the rare case the environment changes at runtime
+    """
+    global _snapshot
+    _ensure_loaded()
+    _snapshot = dict(_env)
+    get_settings.cache_clear()
+    return get_settings()
+
+
+def require_credentials() -> Tuple[str, str]:
+    """
+    Return the Substack EMAIL and PASSWORD, raising if either is unset. Only the premium login path needs them.
+    """
+    settings = get_settings()
+    missing = [name for name in _REQUIRED if not getattr(settings, name)]
+    if missing:
+        raise ValueError(f"Missing environment variables: {', '.join(missing)}")
+    return settings.EMAIL, settings.PASSWORD
+
+
+def __getattr__(name: str) -> str:
+    """
+    Resolve configuration values lazily on first access, e.g. `from config import REMOTE_SERVER`.
+    Unset credentials stay as None in Settings and only raise here, when they are actually read.
+    """
+    if name not in _SETTING_NAMES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(get_settings(), name)
+    if value is None and name in _REQUIRED:
+        raise ValueError(f"{name} environment variable is not set")
+    return value
@@ -1,43 +1,183 @@
 import argparse
+import copy
+import io
+import itertools
 import json
 import os
 from abc import ABC, abstractmethod
-from typing import List, Optional, Tuple
-from time import sleep
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
+from time import monotonic, sleep
 from datetime import datetime
 import re
+import shlex
+import shutil
+import stat
+import sqlite3
+import glob
 import hashlib
-import tempfile
+import html
 import subprocess
-
-from bs4 import BeautifulSoup
+import threading
+import queue
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from contextlib import contextmanager
+
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.element import NavigableString, PreformattedString
+try:
+    import paramiko
+except ImportError:  # Optional: without it, remote file operations use ssh/scp subprocesses
+    paramiko = None
+import soupsieve
 import html2text
 import markdown
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from tqdm import tqdm
-from xml.etree import ElementTree as ET
+from lxml import etree
 
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import InvalidSessionIdException, TimeoutException
 from webdriver_manager.chrome import ChromeDriverManager
 from urllib.parse import urlparse, urljoin
-from config import EMAIL, PASSWORD, REMOTE_SERVER, REMOTE_USER, REMOTE_BASE_DIR, REMOTE_HTML_DIR, SSH_KEY_PATH
+from config import get_settings, require_credentials
 
 USE_PREMIUM: bool = False  # Set to True if you want to login to Substack and convert paid for posts
 BASE_SUBSTACK_URL: str = "https://www.citriniresearch.com/"  # Substack you want to convert to markdown
-BASE_MD_DIR: str = REMOTE_BASE_DIR  # Remote directory for .md essay files
-BASE_HTML_DIR: str = REMOTE_HTML_DIR  # Remote directory for .html essay files
+BASE_MD_DIR: str = get_settings().REMOTE_BASE_DIR  # Remote directory for .md essay files
+BASE_HTML_DIR: str = get_settings().REMOTE_HTML_DIR  # Remote directory for .html essay files
 HTML_TEMPLATE: str = "author_template.html"  # HTML template to use for the author page
 JSON_DATA_DIR: str = "data"
+HTTP_CACHE_PATH: str = os.path.join(JSON_DATA_DIR, "http_cache.sqlite")  # Validators of fetched post lists
 NUM_POSTS_TO_SCRAPE: int = 3  # Set to 0 if you want all posts
+MAX_CONCURRENT_POSTS: int = 10  # Number of posts scraped in parallel by the premium (browser) scraper
+MAX_CONCURRENT_HTTP_POSTS: int = 20  # Number of posts fetched in parallel by the plain HTTP scraper
+MAX_CONCURRENT_IMAGES: int = 8  # Number of images downloaded in parallel, shared by all posts
+HTTP_POOL_CONNECTIONS: int = 16  # Number of hosts to keep connection pools for
+HTTP_POOL_MAXSIZE: int = 32  # Keep-alive connections per host; should cover posts + images in flight
+REQUEST_TIMEOUT: Tuple[int, int] = (5, 30)  # Connect and read timeouts in seconds, so a stalled host cannot hang a worker
+IMAGE_CHUNK_SIZE: int = 1 << 16  # Bytes per read/write when streaming images to disk or the remote server
+IMAGE_COPY_SIZE: int = 1 << 20  # Bytes per read/write when copying an image to a local file; most fit in one
+SFTP_CHANNELS: int = 8  # SFTP sessions opened over the one SSH connection, so that many uploads are in flight at once
+
+# Markdown image syntax ![alt text](url): groups are the "![alt](" prefix, the URL and the closing ")"
+IMAGE_MARKDOWN_RE = re.compile(r'(!\[[^\]]*\]\()(https?://[^\s\)]+)(\))')
+
+# Version number in `chrome --version` output, e.g. "Google Chrome 142.0.7444.175" -> "142.0.7444.175"
+CHROME_VERSION_RE = re.compile(r'(\d+\.\d+\.\d+\.\d+)')
+
+# One Markdown converter per thread, since markdown.Markdown is stateful; reset() between posts is much cheaper
+# than building the converter and its extension patterns again each time
+_markdown_local = threading.local()
+
+# Post page selectors, compiled once instead of being parsed again for every post
+POST_TITLE_SELECTOR = soupsieve.compile("h1.post-title, h2")  # When a video is present, the title is demoted to h2
+POST_SUBTITLE_SELECTOR = soupsieve.compile("h3.subtitle")
+# Post date element; matching on its two distinctive classes is much cheaper than comparing the full class string
+POST_DATE_SELECTOR = soupsieve.compile("div.color-pub-secondary-text-hGQ02T.font-meta-MWBumP")
+POST_LIKE_COUNT_SELECTOR = soupsieve.compile("a.post-ufi-button .label")
+POST_CONTENT_SELECTOR = soupsieve.compile("div.available-content")
+# Elements inside the post body that produce no markdown; inline SVG icons in particular are large
+POST_UNRENDERED_SELECTOR = soupsieve.compile("script, style, svg")
+# Only these subtrees of a post page are built into the soup: the <article> holds the title, date, likes and body,
+# and top-level h2s keep the paywall marker and the h2 title fallback in document order. Navigation, comments, the
+# footer and head scripts are never turned into tag objects.
+POST_PAGE_STRAINER = SoupStrainer(["article", "h2"])
+
+# Resources the premium scraper's browser never needs to fetch, since only the post HTML is extracted. Stylesheets
+# stay allowed: popup and login button handling relies on is_displayed(), which needs the computed styles.
+BLOCKED_URL_PATTERNS: Tuple[str, ...] = (
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.woff", "*.woff2", "*.ttf",
+    "*.mp4", "*.webm", "*.m3u8", "*.mp3", "*.m4a",
+    "*google-analytics*", "*googletagmanager*", "*doubleclick*", "*facebook.net*",
+)
+REMOTE_DEBUGGING_PORT: int = 9222  # DevTools port of the first premium browser; further browsers count up from it
+PAGE_LOAD_TIMEOUT: int = 10  # Seconds to wait for a post's content to appear in the browser
+LOGIN_TIMEOUT: int = 60  # Seconds to wait for login, including any captcha solved by hand
+# Substack's post API, relative to the publication URL; with the browser's login cookies it returns the full body of
+# paid posts, so they can be fetched without loading the page in a browser
+POST_API_PATH: str = "api/v1/posts/"
+# Audiences whose posts the API always returns in full; for any other (paid) audience the body is only trusted to be
+# the full post when it holds at least POST_API_MIN_WORD_RATIO of the post's wordcount, since previews are truncated
+POST_API_FREE_AUDIENCES = frozenset(("everyone", "only_free"))
+POST_API_MIN_WORD_RATIO: float = 0.8
+CLICK_SETTLE_TIMEOUT: int = 3  # Seconds to wait for the page to react to a click, e.g. a login button navigating away
+
+# Page wrapper for each essay's HTML file; see html_wrapper_parts
+HTML_WRAPPER: str = """
+            <!DOCTYPE html>
+            <html lang="en">
+            <head>
+                <meta charset="UTF-8">
+                <meta name="viewport" content="width=device-width, initial-scale=1.0">
+                <title>Markdown Content</title>
+                <link rel="stylesheet" href="__CSS__">
+            </head>
+            <body>
+                <main class="markdown-content">
+                __CONTENT__
+                </main>
+            </body>
+            </html>
+        """
+
 
+# Where Selenium Manager keeps the Chrome for Testing builds it downloads: <platform>/<version>/<binary>
+SELENIUM_CHROME_CACHE: str = os.path.expanduser("~/.cache/selenium/chrome")
+CHROME_FOR_TESTING_BINARIES: Dict[str, str] = {
+    "Darwin": "Google Chrome for Testing.app/Contents/MacOS/Google Chrome for Testing",
+    "Windows": "chrome.exe",
+    "Linux": "chrome",
+}
 
+
+def find_chrome_for_testing() -> Optional[str]:
+    """
+    Returns the path of a Chrome for Testing binary in the Selenium cache, or None if there is none.
+    Only the directory levels of the cache layout are globbed, instead of walking every file below it.
+    """
+    import platform
+
+    binary = CHROME_FOR_TESTING_BINARIES.get(platform.system(), CHROME_FOR_TESTING_BINARIES["Linux"])
+    for depth in ("*/*", "*"):
+        for test_path in glob.iglob(os.path.join(glob.escape(SELENIUM_CHROME_CACHE), depth, binary)):
+            if os.path.isfile(test_path):
+                return test_path
+    return None
+
+
+def _read_app_bundle_version(binary_path: str) -> Optional[str]:
+    """
+    Returns CFBundleShortVersionString from the Info.plist of the .app bundle containing binary_path, or None if the
+    binary is not inside an app bundle or the plist cannot be read
+    """
+    import plistlib
+
+    app_root, sep, _ = binary_path.partition(".app/Contents/MacOS/")
+    if not sep:
+        return None
+    try:
+        with open(os.path.join(f"{app_root}.app", "Contents", "Info.plist"), "rb") as file:
+            version = plistlib.load(file).get("CFBundleShortVersionString")
+    except (OSError, plistlib.InvalidFileException, ValueError):
+        return None
+    return version if isinstance(version, str) and version else None
+
+
+@lru_cache(maxsize=8)
 def get_chrome_version(chrome_path: str = None) -> Optional[str]:
     """
     Detect Chrome browser version from the binary.
     Returns version string like '142.0.7444.175' or None if detection fails.
+    Cached per path, since detection searches the disk and runs the browser binary up to twice.
     """
     import platform
     import json
@@ -54,13 +194,9 @@ def get_chrome_version(chrome_path: str = None) -> Optional[str]:
                 os.path.expanduser("~/Library/Application Support/Google/Chrome/Default"),
             ]
             # Check for Chrome for Testing in cache (used by Selenium)
-            cache_path = os.path.expanduser("~/.cache/selenium/chrome")
-            if os.path.exists(cache_path):
-                for root, dirs, files in os.walk(cache_path):
-                    for d in dirs:
-                        test_path = os.path.join(root, d, "Google Chrome for Testing.app/Contents/MacOS/Google Chrome for Testing")
-                        if os.path.exists(test_path):
-                            chrome_paths.insert(0, test_path)
+            test_path = find_chrome_for_testing()
+            if test_path:
+                chrome_paths.insert(0, test_path)
         elif system == "Windows":
             chrome_paths = [
                 r"C:\Program Files\Google\Chrome\Application\chrome.exe",
@@ -80,6 +216,11 @@ def get_chrome_version(chrome_path: str = None) -> Optional[str]:
     
     if not chrome_binary or not os.path.exists(chrome_binary):
         return None
+
+    # On macOS the version is in the app bundle's Info.plist, which is much cheaper than starting the browser
+    plist_version = _read_app_bundle_version(chrome_binary)
+    if plist_version:
+        return plist_version
     
     try:
         # Try --version flag
@@ -91,7 +232,7 @@ def get_chrome_version(chrome_path: str = None) -> Optional[str]:
         )
         if result.returncode == 0:
             # Extract version number (e.g., "Google Chrome 142.0.7444.175" -> "142.0.7444.175")
-            version_match = re.search(r'(\d+\.\d+\.\d+\.\d+)', result.stdout)
+            version_match = CHROME_VERSION_RE.search(result.stdout)
             if version_match:
                 return version_match.group(1)
     except Exception:
@@ -115,12 +256,149 @@ def get_chrome_version(chrome_path: str = None) -> Optional[str]:
     return None
 
 
+# urlparse is called repeatedly for the same image and post URLs
+cached_urlparse = lru_cache(maxsize=4096)(urlparse)
+
+
+@lru_cache(maxsize=None)
 def extract_main_part(url: str) -> str:
-    parts = urlparse(url).netloc.split('.')  # Parse the URL to get the netloc, and split on '.'
+    parts = cached_urlparse(url).netloc.split('.')  # Parse the URL to get the netloc, and split on '.'
     return parts[1] if parts[0] == 'www' else parts[0]  # Return the main part of the domain, while ignoring 'www' if
     # present
 
 
+@lru_cache(maxsize=None)
+def get_css_path(html_dir: str) -> str:
+    """
+    Returns the relative path from an HTML directory to the essay stylesheet, with forward slashes for web paths
+    """
+    return os.path.relpath("./assets/css/essay-styles.css", html_dir).replace("\\", "/")
+
+
+def render_api_post(post: dict) -> str:
+    """
+    Renders a post from Substack's post API as the minimal page markup extract_post_data reads: the same title,
+    subtitle, date, like count and body elements a post page has
+    """
+    post_date = post.get("post_date") or ""
+    try:
+        # post_date is UTC, e.g. "2024-10-01T23:30:00.000Z"; the post page shows it in the browser's local time zone,
+        # so it is converted the same way before being displayed like on the page, e.g. "Oct 01, 2024"
+        published = datetime.fromisoformat(post_date.replace("Z", "+00:00")).astimezone()
+        date = published.strftime("%b %d, %Y")
+    except ValueError:
+        date = ""
+    return (
+        "<article>"
+        f'<h1 class="post-title">{html.escape(post.get("title") or "")}</h1>'
+        f'<h3 class="subtitle">{html.escape(post.get("subtitle") or "")}</h3>'
+        f'<div class="color-pub-secondary-text-hGQ02T font-meta-MWBumP">{date}</div>'
+        f'<a class="post-ufi-button"><span class="label">{int(post.get("reaction_count") or 0)}</span></a>'
+        f'<div class="available-content">{post.get("body_html") or ""}</div>'
+        "</article>"
+    )
+
+
+@lru_cache(maxsize=None)
+def html_wrapper_parts(css_path: str) -> Tuple[bytes, bytes]:
+    """
+    Returns HTML_WRAPPER with the stylesheet link filled in, split around __CONTENT__ and encoded once, so each post
+    page is written as head, content and tail without building the whole page as one string
+    """
+    head, tail = HTML_WRAPPER.replace("__CSS__", css_path).split("__CONTENT__")
+    return head.encode('utf-8'), tail.encode('utf-8')
+
+
+def write_text_file(filepath: str, content: str) -> None:
+    """
+    Writes content as UTF-8 with a single write call, bypassing the text-mode wrapper and its incremental encoder
+    """
+    data = content.encode('utf-8')
+    with open(filepath, 'wb') as file:
+        file.write(data)
+
+
+@lru_cache(maxsize=4096)
+def image_url_hash(image_url: str) -> str:
+    """
+    Returns a short, stable hex name for an image URL. blake2b is faster than md5 and needs no extra dependency.
+    """
+    return hashlib.blake2b(image_url.encode(), digest_size=4).hexdigest()
+
+
+# Date prefix that get_filename_from_url puts in front of the post slug
+DATED_FILENAME_RE = re.compile(r'^\d{4}-\d{2}-\d{2}_')
+
+
+# Common Substack date formats to try, split by whether the date starts with a digit so that a date is only tried
+# against the formats it could match
+ALPHA_DATE_FORMATS: Tuple[str, ...] = (
+    "%b %d, %Y",      # "Jan 15, 2024" (the most common on Substack, so tried first)
+    "%B %d, %Y",      # "January 15, 2024"
+    "%b %d",          # "Jan 15" (assume current year)
+    "%B %d",          # "January 15" (assume current year)
+)
+NUMERIC_DATE_FORMATS: Tuple[str, ...] = (
+    "%d %b %Y",       # "15 Jan 2024"
+    "%d %B %Y",       # "15 January 2024"
+    "%Y-%m-%d",       # "2024-01-15"
+    "%m/%d/%Y",       # "01/15/2024"
+    "%d/%m/%Y",       # "15/01/2024"
+)
+DATE_FORMATS: Tuple[str, ...] = ALPHA_DATE_FORMATS + NUMERIC_DATE_FORMATS
+
+# Year assumed for dates shown without one, i.e. posts from this year; read once per run
+CURRENT_YEAR: int = datetime.now().year
+
+# Year, month name and day tokens for the fallback in parse_date_to_iso, found in one scan of the string
+DATE_TOKEN_RE = re.compile(
+    r'\b(?:(?P<year>20\d{2})'
+    r'|(?P<month>january|february|march|april|may|june|july|august|september|october|november|december'
+    r'|jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)'
+    r'|(?P<day>\d{1,2}))\b',
+    re.IGNORECASE
+)
+
+# Month numbers keyed by the first three letters, which identify both the full and the abbreviated names
+MONTH_MAP: Dict[str, int] = {
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
+    'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12
+}
+
+# Longer strings are not one of DATE_FORMATS, so strptime is not tried on them
+MAX_FORMATTED_DATE_LENGTH: int = 25
+
+
+def _parse_numeric_date(date_str: str) -> Optional[str]:
+    """
+    Fast path for "YYYY-MM-DD" and "MM/DD/YYYY" (or "DD/MM/YYYY") dates, avoiding failed strptime attempts.
+    Returns None if the string does not have one of these shapes or is not a valid date.
+    """
+    if len(date_str) != 10:
+        return None
+
+    if date_str[4] == '-' and date_str[7] == '-':
+        year, first, second = date_str[0:4], date_str[5:7], date_str[8:10]
+        candidates = ((first, second),)
+    elif date_str[2] == '/' and date_str[5] == '/':
+        year, first, second = date_str[6:10], date_str[0:2], date_str[3:5]
+        candidates = ((first, second), (second, first))  # Month first, then day first, like DATE_FORMATS
+    else:
+        return None
+
+    if not (year.isdigit() and first.isdigit() and second.isdigit()):
+        return None
+
+    for month, day in candidates:
+        try:
+            datetime(int(year), int(month), int(day))
+        except ValueError:
+            continue
+        return f"{year}-{month}-{day}"
+    return None
+
+
+@lru_cache(maxsize=8192)
 def parse_date_to_iso(date_str: str) -> str:
     """
     Parse various date formats from Substack and convert to YYYY-MM-DD format.
@@ -128,51 +406,37 @@ def parse_date_to_iso(date_str: str) -> str:
     """
     if not date_str or date_str == "Date not found":
         return ""
+
+    stripped = date_str.strip()
+    numeric_date = _parse_numeric_date(stripped)
+    if numeric_date:
+        return numeric_date
     
-    # Common Substack date formats to try
-    date_formats = [
-        "%B %d, %Y",      # "January 15, 2024"
-        "%b %d, %Y",      # "Jan 15, 2024"
-        "%d %B %Y",       # "15 January 2024"
-        "%d %b %Y",       # "15 Jan 2024"
-        "%Y-%m-%d",       # "2024-01-15"
-        "%m/%d/%Y",       # "01/15/2024"
-        "%d/%m/%Y",       # "15/01/2024"
-        "%B %d",          # "January 15" (assume current year)
-        "%b %d",          # "Jan 15" (assume current year)
-    ]
-    
-    for fmt in date_formats:
-        try:
-            parsed_date = datetime.strptime(date_str.strip(), fmt)
-            # If no year in format, assume current year
-            if parsed_date.year == 1900:  # Default year when not specified
-                parsed_date = parsed_date.replace(year=datetime.now().year)
-            return parsed_date.strftime("%Y-%m-%d")
-        except ValueError:
-            continue
+    if len(stripped) <= MAX_FORMATTED_DATE_LENGTH:
+        # Every failed strptime raises, so skip the formats whose first field cannot match
+        formats = NUMERIC_DATE_FORMATS if stripped[:1].isdigit() else ALPHA_DATE_FORMATS
+        for fmt in formats:
+            try:
+                parsed_date = datetime.strptime(stripped, fmt)
+                # If no year in format, assume current year
+                if parsed_date.year == 1900:  # Default year when not specified
+                    parsed_date = parsed_date.replace(year=CURRENT_YEAR)
+                return parsed_date.strftime("%Y-%m-%d")
+            except ValueError:
+                continue
     
-    # If all parsing fails, try to extract year, month, day using regex
-    year_match = re.search(r'\b(20\d{2})\b', date_str)
-    month_match = re.search(r'\b(january|february|march|april|may|june|july|august|september|october|november|december|jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\b', date_str.lower())
-    day_match = re.search(r'\b(\d{1,2})\b', date_str)
+    # If all parsing fails, try to extract year, month, day using regex; the first token of each kind is used
+    tokens: Dict[str, str] = {}
+    for match in DATE_TOKEN_RE.finditer(date_str):
+        tokens.setdefault(match.lastgroup, match.group(match.lastgroup))
+        if len(tokens) == 3:
+            break
     
-    if year_match and month_match and day_match:
+    if len(tokens) == 3:
         try:
-            year = int(year_match.group(1))
-            month_name = month_match.group(1)
-            day = int(day_match.group(1))
-            
-            # Convert month name to number
-            month_map = {
-                'january': 1, 'jan': 1, 'february': 2, 'feb': 2,
-                'march': 3, 'mar': 3, 'april': 4, 'apr': 4,
-                'may': 5, 'june': 6, 'jun': 6, 'july': 7, 'jul': 7,
-                'august': 8, 'aug': 8, 'september': 9, 'sep': 9,
-                'october': 10, 'oct': 10, 'november': 11, 'nov': 11,
-                'december': 12, 'dec': 12
-            }
-            month = month_map.get(month_name.lower(), 1)
+            year = int(tokens["year"])
+            month = MONTH_MAP[tokens["month"][:3].lower()]
+            day = int(tokens["day"])
             
             parsed_date = datetime(year, month, day)
             return parsed_date.strftime("%Y-%m-%d")
@@ -183,37 +447,289 @@ def parse_date_to_iso(date_str: str) -> str:
     return date_str
 
 
+# Markdown conversion of the post body, walking the already-parsed soup instead of serializing it for html2text to
+# parse a second time. html2text is still available through --legacy-markdown.
+MD_WHITESPACE_RE = re.compile(r'\s+')
+MD_HEADING_LEVELS: Dict[str, int] = {"h1": 1, "h2": 2, "h3": 3, "h4": 4, "h5": 5, "h6": 6}
+# Asterisks rather than underscores for emphasis, since only they still work inside a word
+MD_INLINE_MARKS: Dict[str, str] = {"strong": "**", "b": "**", "em": "*", "i": "*", "s": "~~", "del": "~~"}
+# Characters in post text that markdown would otherwise read as emphasis, links or code
+MD_INLINE_ESCAPE_RE = re.compile(r'([\\`*_\[\]])')
+# Text at the start of a line that markdown would read as a heading, quote, list item or setext underline
+MD_LINE_START_ESCAPE_RE = re.compile(r'^([#>+=-])')
+MD_ORDERED_START_ESCAPE_RE = re.compile(r'^(\d+)([.)])(?=\s|$)')
+MD_BACKTICK_RUN_RE = re.compile(r'`+')
+# Tags that start a new block; any other tag is rendered inline as part of the surrounding paragraph
+MD_BLOCK_TAGS = frozenset((
+    "p", "div", "section", "article", "header", "footer", "figure", "figcaption", "blockquote", "pre", "ul", "ol",
+    "li", "hr", "table", "h1", "h2", "h3", "h4", "h5", "h6",
+))
+MD_SKIPPED_TAGS = frozenset(("script", "style", "svg", "noscript", "head"))
+# Python-Markdown only nests list content indented by four spaces, whatever the marker's width
+MD_LIST_INDENT: str = " " * 4
+
+
+def _wrap_inline(text: str, mark: str) -> str:
+    """
+    Wraps inline text in an emphasis mark, keeping surrounding whitespace outside so the markdown stays valid
+    """
+    stripped = text.strip()
+    if not stripped:
+        return text
+    leading = text[:len(text) - len(text.lstrip())]
+    trailing = text[len(text.rstrip()):]
+    return f"{leading}{mark}{stripped}{mark}{trailing}"
+
+
+def _code_span(code: str) -> str:
+    """
+    Wraps inline code in a backtick fence longer than any backtick run inside it, padded with spaces when the code
+    starts or ends with a backtick so the fence stays separate
+    """
+    if not code:
+        return ""
+    fence = "`" * (max((len(run) for run in MD_BACKTICK_RUN_RE.findall(code)), default=0) + 1)
+    if code.startswith("`") or code.endswith("`"):
+        code = f" {code} "
+    return f"{fence}{code}{fence}"
+
+
+def _inline_to_md(node) -> str:
+    """
+    Renders a node and its descendants as inline markdown. Line breaks come out as bare newlines for
+    _finish_paragraph to turn into hard breaks.
+    """
+    if isinstance(node, NavigableString):
+        if isinstance(node, PreformattedString):  # Comments, CDATA, doctypes
+            return ""
+        return MD_INLINE_ESCAPE_RE.sub(r"\\\1", MD_WHITESPACE_RE.sub(" ", node))
+
+    name = node.name
+    if name in MD_SKIPPED_TAGS:
+        return ""
+    if name == "br":
+        return "\n"
+    if name == "img":
+        src = node.get("src")
+        alt = MD_INLINE_ESCAPE_RE.sub(r"\\\1", node.get("alt", ""))
+        return f"![{alt}]({src})" if src else ""
+    if name == "code":
+        return _code_span(node.get_text())
+
+    text = "".join(_inline_to_md(child) for child in node.children)
+    mark = MD_INLINE_MARKS.get(name)
+    if mark:
+        return _wrap_inline(text, mark)
+    if name == "a":
+        href = node.get("href")
+        if href and text.strip():
+            return f"[{text.strip()}]({href})"
+    return text
+
+
+def _escape_line_start(line: str) -> str:
+    """
+    Backslash-escapes a leading character that would turn a line of text into a block, e.g. "2024. A year" into
+    "2024\\. A year"
+    """
+    line = MD_LINE_START_ESCAPE_RE.sub(r"\\\1", line)
+    return MD_ORDERED_START_ESCAPE_RE.sub(r"\1\\\2", line)
+
+
+def _finish_paragraph(text: str) -> str:
+    """
+    Collapses the spaces within each line of an inline run and joins the lines with markdown hard line breaks.
+    Lines are escaped where their text would start a block; the markup the converter adds never starts that way.
+    """
+    lines = [_escape_line_start(" ".join(line.split())) for line in text.split("\n")]
+    return "  \n".join(line for line in lines if line)
+
+
+def _indent_block(text: str, first_prefix: str, prefix: str) -> str:
+    """
+    Prefixes the first line of a block with first_prefix and every other non-empty line with prefix
+    """
+    lines = text.split("\n")
+    return "\n".join(
+        [first_prefix + lines[0]] + [prefix + line if line else line for line in lines[1:]]
+    )
+
+
+def _list_to_md(node) -> str:
+    """
+    Renders a <ul> or <ol> with one marker per <li>, indenting continuation lines and nested lists under it
+    """
+    ordered = node.name == "ol"
+    try:
+        number = int(node.get("start", 1))
+    except ValueError:
+        number = 1
+    items = []
+    for item in node.find_all("li", recursive=False):
+        marker = f"{number}. " if ordered else "* "
+        number += 1
+        blocks = []
+        _blocks_to_md(item, blocks)
+        items.append(_indent_block("\n\n".join(blocks), marker, MD_LIST_INDENT))
+    return "\n".join(items)
+
+
+def _table_to_md(node) -> str:
+    """
+    Renders a table as a pipe table, treating the first row as the header
+    """
+    rows = []
+    for row in node.find_all("tr"):
+        cells = [
+            _finish_paragraph(_inline_to_md(cell)).replace("  \n", " ").replace("|", "\\|")
+            for cell in row.find_all(("th", "td"), recursive=False)
+        ]
+        rows.append("| " + " | ".join(cells) + " |")
+        if len(rows) == 1:
+            rows.append("|" + " --- |" * len(cells))
+    return "\n".join(rows)
+
+
+def _blocks_to_md(node, blocks: List[str]) -> None:
+    """
+    Appends the markdown blocks of a node's children to blocks. Consecutive inline children form one paragraph.
+    """
+    inline_parts: List[str] = []
+
+    def flush() -> None:
+        paragraph = _finish_paragraph("".join(inline_parts))
+        if paragraph:
+            blocks.append(paragraph)
+        inline_parts.clear()
+
+    for child in node.children:
+        name = getattr(child, "name", None)
+        if name not in MD_BLOCK_TAGS:
+            inline_parts.append(_inline_to_md(child))
+            continue
+
+        flush()
+        if name in MD_HEADING_LEVELS:
+            heading = _finish_paragraph(_inline_to_md(child)).replace("  \n", " ")
+            if heading:
+                blocks.append("#" * MD_HEADING_LEVELS[name] + " " + heading)
+        elif name in ("ul", "ol"):
+            rendered = _list_to_md(child)
+            if rendered:
+                blocks.append(rendered)
+        elif name == "pre":
+            blocks.append("```\n" + child.get_text().strip("\n") + "\n```")
+        elif name == "blockquote":
+            quoted: List[str] = []
+            _blocks_to_md(child, quoted)
+            if quoted:
+                blocks.append(_indent_block("\n\n".join(quoted), "> ", "> ").replace("\n\n", "\n>\n"))
+        elif name == "hr":
+            blocks.append("* * *")
+        elif name == "table":
+            blocks.append(_table_to_md(child))
+        else:
+            # Paragraphs and containers (div, figure, a stray li); their inline content becomes its own paragraph
+            _blocks_to_md(child, blocks)
+    flush()
+
+
+def element_to_markdown(element) -> str:
+    """
+    Converts a parsed HTML element, such as the post body, to Markdown
+    """
+    if element is None:
+        return ""
+    blocks: List[str] = []
+    _blocks_to_md(element, blocks)
+    return "\n\n".join(blocks) + "\n"
+
+
 class RemoteFileHandler:
     """
     Handles file operations on a remote server via SSH/SCP
     """
     
-    def __init__(self, server: str, user: str, base_dir: str, ssh_key_path: str = None):
+    def __init__(
+            self, server: str, user: str, base_dir: str, ssh_key_path: str = None, channels: int = SFTP_CHANNELS
+    ):
         self.server = server
         self.user = user
         self.base_dir = base_dir
-        self.ssh_key_path = os.path.expanduser(ssh_key_path or "~/.ssh/id_rsa")
-        
-        # Test connection on initialization
-        if not self.test_connection():
+        # Settings.SSH_KEY_PATH is already expanded; only the fallback needs resolving
+        self.ssh_key_path = ssh_key_path or os.path.expanduser("~/.ssh/id_rsa")
+
+        # One SSH connection with a pool of SFTP channels for all file operations when paramiko is available; otherwise
+        # (or if it cannot connect) every operation runs its own ssh/scp subprocess
+        self._ssh = None
+        self._sftp_pool: Optional[queue.Queue] = None
+        self._channels = channels
+        # Remote directory -> names in it, listed once and kept up to date with our own writes, so each existence
+        # check is a set lookup instead of a round trip
+        self._dir_cache: Dict[str, Set[str]] = {}
+        self._dir_cache_lock = threading.Lock()
+        self._ensured_dirs: Set[str] = set()
+        # Result of test_connection once known; a working SFTP session already proves the connection
+        self._connection_ok: Optional[bool] = None
+
+        # Test connection on initialization; a failed _open_sftp has already closed its half-open connection
+        if not self._open_sftp() and not self.test_connection():
             raise ConnectionError(f"Could not connect to remote server {self.user}@{self.server}")
-    
-    def test_connection(self) -> bool:
+
+        # Runs the writes of save_many concurrently, one SFTP channel each; created last so a failed connection leaves
+        # no worker threads behind
+        self._upload_executor = ThreadPoolExecutor(max_workers=channels)
+
+    def _open_sftp(self) -> bool:
         """
-        Test SSH connection to the remote server
+        Open the persistent paramiko SSH connection and its SFTP channels.
+        Returns False if paramiko is missing or the connection fails.
         """
+        if paramiko is None:
+            return False
+        client = paramiko.SSHClient()
         try:
-            success, output = self._run_ssh_command("echo 'Connection test successful'")
-            if success:
-                print(f"[OK] Successfully connected to {self.user}@{self.server}")
-                return True
-            else:
-                print(f"[ERROR] Failed to connect to {self.user}@{self.server}: {output}")
-                return False
+            client.set_missing_host_key_policy(paramiko.AutoAddPolicy())  # Like StrictHostKeyChecking=no
+            client.connect(self.server, username=self.user, key_filename=self.ssh_key_path, timeout=10)
+            # An SFTPClient handles one request at a time, so each concurrent operation checks out its own channel
+            pool = queue.Queue()
+            for _ in range(self._channels):
+                pool.put(client.open_sftp())
         except Exception as e:
-            print(f"[ERROR] Connection test failed: {e}")
+            client.close()
+            print(f"[WARNING] SFTP session unavailable, using ssh/scp commands instead: {e}")
             return False
-        
+        except BaseException:
+            client.close()  # Interrupted mid-connect; don't leave the transport open
+            raise
+        self._ssh = client
+        self._sftp_pool = pool
+        self._connection_ok = True
+        print(f"[OK] Opened {self._channels} SFTP channels to {self.user}@{self.server}")
+        return True
+
+    @contextmanager
+    def _sftp_channel(self):
+        """
+        Check an SFTP channel out of the pool for the duration of the block
+        """
+        sftp = self._sftp_pool.get()
+        try:
+            yield sftp
+        finally:
+            self._sftp_pool.put(sftp)
+
+    def close(self) -> None:
+        """
+        Close the SFTP channels and their SSH connection, if open
+        """
+        self._upload_executor.shutdown(wait=True)
+        if self._ssh is not None:
+            while not self._sftp_pool.empty():
+                self._sftp_pool.get_nowait().close()
+            self._ssh.close()
+            self._sftp_pool = self._ssh = None
+    
     def _run_ssh_command(self, command: str, max_retries: int = 3) -> Tuple[bool, str]:
         """
         Run an SSH command on the remote server with improved error logging and connection reuse
@@ -282,94 +798,136 @@ class RemoteFileHandler:
         
         return False, "All SSH command attempts failed"
     
-    def _run_scp_command(self, local_path: str, remote_path: str, max_retries: int = 3) -> Tuple[bool, str]:
+    def _run_ssh_write(self, data: bytes, remote_path: str, max_retries: int = 3) -> Tuple[bool, str]:
         """
-        Copy a file to the remote server using SCP with retry logic
+        Write data to a remote file by piping it into `cat` over SSH, so nothing is staged in a local temporary file
         """
+        ssh_cmd = [
+            "ssh",
+            "-i", self.ssh_key_path,
+            "-o", "StrictHostKeyChecking=no",
+            "-o", "ConnectTimeout=10",
+            "-o", "ControlMaster=auto",
+            "-o", "ControlPath=~/.ssh/control-%r@%h:%p",
+            "-o", "ControlPersist=60",
+            f"{self.user}@{self.server}",
+            f"cat > {shlex.quote(remote_path)}"
+        ]
+        error_msg = "All SSH write attempts failed"
         for attempt in range(max_retries):
             try:
-                scp_cmd = [
-                    "scp",
-                    "-i", self.ssh_key_path,
-                    "-o", "StrictHostKeyChecking=no",
-                    "-o", "ConnectTimeout=10",
-                    "-o", "ControlMaster=auto",
-                    "-o", "ControlPath=~/.ssh/control-%r@%h:%p",
-                    "-o", "ControlPersist=60",
-                    local_path,
-                    f"{self.user}@{self.server}:{remote_path}"
-                ]
-                
-                # print(f"[DEBUG] SCP command: {' '.join(scp_cmd)}")
-                # print(f"[DEBUG] Local file exists: {os.path.exists(local_path)}")
-                # print(f"[DEBUG] Local file size: {os.path.getsize(local_path) if os.path.exists(local_path) else 'N/A'}")
-                
-                result = subprocess.run(scp_cmd, capture_output=True, text=True, timeout=30)
-                
-                # print(f"[DEBUG] SCP return code: {result.returncode}")
-                # print(f"[DEBUG] SCP stdout: '{result.stdout}'")
-                # print(f"[DEBUG] SCP stderr: '{result.stderr}'")
-                
+                result = subprocess.run(ssh_cmd, input=data, capture_output=True, timeout=30)
                 if result.returncode == 0:
-                    return True, result.stdout
-                else:
-                    # Improved error logging - show actual error details
-                    error_details = []
-                    if result.stderr:
-                        error_details.append(f"stderr: {result.stderr}")
-                    if result.stdout:
-                        error_details.append(f"stdout: {result.stdout}")
-                    if result.returncode != 0:
-                        error_details.append(f"exit code: {result.returncode}")
-                    
-                    error_msg = "; ".join(error_details) if error_details else "Unknown SCP error"
-                    
-                    if attempt < max_retries - 1:
-                        print(f"[ERROR] SCP command failed (attempt {attempt + 1}/{max_retries}): {error_msg}")
-                        sleep(2)  # Wait before retry
-                        continue
-                    return False, error_msg
+                    return True, ""
+                error_msg = f"stderr: {result.stderr.decode(errors='replace')}; exit code: {result.returncode}"
             except subprocess.TimeoutExpired:
-                if attempt < max_retries - 1:
-                    print(f"[ERROR] SCP command timed out (attempt {attempt + 1}/{max_retries})")
-                    sleep(2)
-                    continue
-                return False, "SCP command timed out"
+                error_msg = "SSH write timed out"
             except Exception as e:
-                if attempt < max_retries - 1:
-                    print(f"[ERROR] SCP command failed (attempt {attempt + 1}/{max_retries}): {str(e)}")
-                    sleep(2)
-                    continue
-                return False, f"SCP command failed: {str(e)}"
-        
-        return False, "All SCP command attempts failed"
-    
+                error_msg = f"SSH write failed: {str(e)}"
+            if attempt < max_retries - 1:
+                print(f"[ERROR] SSH write failed (attempt {attempt + 1}/{max_retries}): {error_msg}")
+                sleep(2)
+        return False, error_msg
+
     def test_connection(self) -> bool:
         """
-        Test SSH connection to the remote server
+        Test SSH connection to the remote server. The result is remembered, so only the first call costs a round trip.
         """
+        if self._connection_ok is not None:
+            return self._connection_ok
+
         # print(f"[DEBUG] Testing SSH connection to {self.user}@{self.server}")
         success, output = self._run_ssh_command("echo 'SSH connection test successful'")
         if success:
             print(f"[OK] SSH connection test passed: {output.strip()}")
-            return True
         else:
             print(f"[ERROR] SSH connection test failed: {output}")
-            return False
+        self._connection_ok = success
+        return success
     
     def ensure_directory_exists(self, remote_path: str) -> bool:
         """
-        Ensure a directory exists on the remote server
+        Ensure a directory exists on the remote server. Directories already ensured during this run are not checked
+        again, since save_file ensures the directory of every file it writes.
         """
-        success, output = self._run_ssh_command(f"mkdir -p {remote_path}")
-        if not success:
-            print(f"Warning: Could not create directory {remote_path}: {output}")
+        if remote_path in self._ensured_dirs:
+            return True
+
+        if self._sftp_pool is not None:
+            try:
+                with self._sftp_channel() as sftp:
+                    self._sftp_makedirs(sftp, remote_path)
+                success = True
+            except IOError as e:
+                print(f"Warning: Could not create directory {remote_path}: {e}")
+                return False
+        else:
+            success, output = self._run_ssh_command(f"mkdir -p {remote_path}")
+            if not success:
+                print(f"Warning: Could not create directory {remote_path}: {output}")
+        if success:
+            self._ensured_dirs.add(remote_path)
         return success
     
+    def _sftp_makedirs(self, sftp, remote_path: str) -> None:
+        """
+        SFTP equivalent of mkdir -p
+        """
+        try:
+            sftp.stat(remote_path)
+            return
+        except FileNotFoundError:
+            pass
+        parent = os.path.dirname(remote_path.rstrip("/"))
+        if parent and parent != remote_path:
+            self._sftp_makedirs(sftp, parent)
+        sftp.mkdir(remote_path)
+
+    def existing_files(self, remote_dir: str) -> Optional[Set[str]]:
+        """
+        Returns the names in a remote directory, listing it on the first call only, or None if it cannot be listed
+        """
+        with self._dir_cache_lock:
+            names = self._dir_cache.get(remote_dir)
+        if names is not None:
+            return names
+
+        listing = self.list_files(remote_dir)
+        if listing is None:
+            return None
+        with self._dir_cache_lock:
+            return self._dir_cache.setdefault(remote_dir, set(listing))
+
+    def _remember_file(self, remote_path: str) -> None:
+        """
+        Records a file we just wrote in the cached listing of its directory, if that directory was listed
+        """
+        remote_dir, name = os.path.split(remote_path)
+        with self._dir_cache_lock:
+            names = self._dir_cache.get(remote_dir)
+            if names is not None:
+                names.add(name)
+
     def file_exists(self, remote_path: str) -> bool:
         """
         Check if a file exists on the remote server
         """
+        # One listing per directory answers every check in it
+        remote_dir, name = os.path.split(remote_path)
+        names = self.existing_files(remote_dir)
+        if names is not None:
+            return name in names
+
+        if self._sftp_pool is not None:
+            try:
+                with self._sftp_channel() as sftp:
+                    return stat.S_ISREG(sftp.stat(remote_path).st_mode)
+            except FileNotFoundError:
+                return False
+            except IOError as e:
+                print(f"[DEBUG] File existence check failed for {remote_path}: {e}")
+                return False
+
         success, output = self._run_ssh_command(f"test -f {remote_path}")
         
         # Handle the case where test -f returns exit code 1 (file doesn't exist)
@@ -386,34 +944,105 @@ class RemoteFileHandler:
         
         return success
     
-    def save_file(self, content: str, remote_path: str) -> bool:
+    def list_files(self, remote_dir: str) -> Optional[List[str]]:
+        """
+        List the file names in a directory on the remote server, or None if it cannot be read
+        """
+        if self._sftp_pool is not None:
+            try:
+                with self._sftp_channel() as sftp:
+                    return sftp.listdir(remote_dir)
+            except IOError:
+                return None
+
+        success, output = self._run_ssh_command(f"ls -1 {shlex.quote(remote_dir)} 2>/dev/null")
+        if not success:
+            return None
+        return output.splitlines()
+
+    def save_file(self, content: Union[str, bytes], remote_path: str) -> bool:
         """
-        Save content to a file on the remote server
+        Save content to a file on the remote server. Text is written as UTF-8; bytes, such as image data, as they are.
         """
         # Create the directory if it doesn't exist
         remote_dir = os.path.dirname(remote_path)
         if not self.ensure_directory_exists(remote_dir):
             return False
-        
-        # Write content to a temporary local file
-        with tempfile.NamedTemporaryFile(mode='w', encoding='utf-8', delete=False) as temp_file:
-            temp_file.write(content)
-            temp_local_path = temp_file.name
-        
-        try:
-            # Copy the file to the remote server
-            success, output = self._run_scp_command(temp_local_path, remote_path)
-            if not success:
-                print(f"Error saving file {remote_path}: {output}")
-            return success
-        finally:
-            # Clean up the temporary file
-            os.unlink(temp_local_path)
+
+        data = content.encode('utf-8') if isinstance(content, str) else content
+        success, output = self.upload_bytes(data, remote_path)
+        if not success:
+            print(f"Error saving file {remote_path}: {output}")
+        return success
     
+    def save_stream(self, chunks: Iterable[bytes], remote_path: str) -> bool:
+        """
+        Save data arriving in chunks, such as a streamed download, to a file on the remote server. Over SFTP each chunk
+        is written as it arrives, so the whole file is never held in memory.
+        """
+        remote_dir = os.path.dirname(remote_path)
+        if not self.ensure_directory_exists(remote_dir):
+            return False
+
+        if self._sftp_pool is None:
+            # Piping through ssh needs the whole file up front
+            return self.save_file(b"".join(chunks), remote_path)
+
+        with self._sftp_channel() as sftp:
+            try:
+                with sftp.open(remote_path, "wb") as remote_file:
+                    # Don't wait for each write to be acknowledged before sending the next chunk
+                    remote_file.set_pipelined(True)
+                    for chunk in chunks:
+                        remote_file.write(chunk)
+            except Exception as e:
+                print(f"Error saving file {remote_path}: {e}")
+                try:
+                    sftp.remove(remote_path)  # Don't leave a truncated file that later runs would treat as saved
+                except IOError:
+                    pass
+                return False
+        self._remember_file(remote_path)
+        return True
+
+    def save_many(self, files: List[Tuple[str, Union[str, bytes]]]) -> List[bool]:
+        """
+        Save several (remote_path, content) files concurrently, so their round trips overlap instead of adding up.
+        Returns whether each file was saved, in the order given.
+        """
+        return list(self._upload_executor.map(lambda file: self.save_file(file[1], file[0]), files))
+
+    def upload_bytes(self, data: bytes, remote_path: str) -> Tuple[bool, str]:
+        """
+        Write data to a file on the remote server straight from memory, over SFTP or else piped through SSH.
+        The remote directory must already exist.
+        """
+        if self._sftp_pool is not None:
+            try:
+                with self._sftp_channel() as sftp:
+                    sftp.putfo(io.BytesIO(data), remote_path)
+                success, output = True, ""
+            except IOError as e:
+                success, output = False, str(e)
+        else:
+            success, output = self._run_ssh_write(data, remote_path)
+        if success:
+            self._remember_file(remote_path)
+        return success, output
+
     def download_file(self, remote_path: str, local_path: str) -> bool:
         """
         Download a file from the remote server
         """
+        if self._sftp_pool is not None:
+            try:
+                with self._sftp_channel() as sftp:
+                    sftp.get(remote_path, local_path)
+                return True
+            except IOError as e:
+                print(f"Error downloading file {remote_path}: {str(e)}")
+                return False
+
         try:
             scp_cmd = [
                 "scp",
@@ -429,45 +1058,214 @@ class RemoteFileHandler:
             return False
 
 
-def generate_html_file(author_name: str) -> None:
-    """
-    Generates a HTML file for the given author.
-    """
-    # Create remote file handler
-    remote_handler = RemoteFileHandler(REMOTE_SERVER, REMOTE_USER, REMOTE_BASE_DIR, SSH_KEY_PATH)
-    
-    # Ensure remote HTML directory exists
-    remote_handler.ensure_directory_exists(REMOTE_HTML_DIR)
+SITEMAP_NS: str = "http://www.sitemaps.org/schemas/sitemap/0.9"
+SITEMAP_URL_TAG: str = f"{{{SITEMAP_NS}}}url"
+SITEMAP_CHILD_TAG: str = f"{{{SITEMAP_NS}}}sitemap"  # Entry of a sitemap index, pointing at another sitemap
+# Compiled once and evaluated in C per <url>/<item>, returning the link as a plain str ("" if missing) that keeps
+# no reference back to the parsed tree
+SITEMAP_LOC_XPATH = etree.XPath("string(s:loc)", namespaces={"s": SITEMAP_NS}, smart_strings=False)
+FEED_LINK_XPATH = etree.XPath("string(link)", smart_strings=False)
+
+
+def iter_xml_elements(source, tag: Union[str, Tuple[str, ...]]):
+    """
+    Incrementally parses XML from a file-like object, yielding each element with the given tag(s) once complete.
+    Elements are freed after use, so memory stays flat however large the document is.
+    """
+    # Entities are not expanded, so a hostile sitemap cannot blow up memory
+    for _, element in etree.iterparse(source, events=("end",), tag=tag, resolve_entities=False):
+        yield element
+        element.clear()
+        while element.getprevious() is not None:
+            del element.getparent()[0]
+
+
+# Placeholders in HTML_TEMPLATE, matched together so the template is scanned once
+ESSAYS_DATA_TAG: str = '<script type="application/json" id="essaysData"></script>'
+TEMPLATE_PLACEHOLDER_RE = re.compile(
+    "|".join(re.escape(placeholder) for placeholder in ('<!-- AUTHOR_NAME -->', ESSAYS_DATA_TAG, 'author_name'))
+)
+
+
+@lru_cache(maxsize=1)
+def load_html_template() -> str:
+    """
+    Reads the author page template, once per process
+    """
+    with open(HTML_TEMPLATE, 'r', encoding='utf-8') as file:
+        return file.read()
+
+
+def generate_html_file(
+        author_name: str, embedded_json_data: Optional[str] = None, remote_handler: Optional[RemoteFileHandler] = None
+) -> None:
+    """
+    Generates a HTML file for the given author.
+    embedded_json_data is the author's essays JSON as returned by save_essays_data_to_json; if not given, it is
+    read from the author's JSON file.
+    remote_handler is an open handler to upload with, such as the scraper's; it is left open. Without one, a
+    single-channel handler is opened for this upload and closed afterwards.
+    """
+    if remote_handler is not None:
+        _write_author_html(author_name, embedded_json_data, remote_handler)
+        return
+
+    settings = get_settings()
+    remote_handler = RemoteFileHandler(
+        settings.REMOTE_SERVER, settings.REMOTE_USER, settings.REMOTE_BASE_DIR, settings.SSH_KEY_PATH, channels=1
+    )
+    try:
+        _write_author_html(author_name, embedded_json_data, remote_handler)
+    finally:
+        remote_handler.close()
+
+
+def _write_author_html(author_name: str, embedded_json_data: Optional[str], remote_handler: RemoteFileHandler) -> None:
+    """
+    Fills the author page template and uploads it to the remote HTML directory
+    """
+    settings = get_settings()
+
+    # Ensure remote HTML directory exists
+    remote_handler.ensure_directory_exists(settings.REMOTE_HTML_DIR)
+
+    # The JSON file is written with the formatting the page embeds, so its text is used as-is instead of being
+    # decoded and encoded again
+    if embedded_json_data is None:
+        json_path = os.path.join(JSON_DATA_DIR, f'{author_name}.json')
+        with open(json_path, 'r', encoding='utf-8') as file:
+            embedded_json_data = file.read()
+
+    # Insert the author name and the JSON string into the HTML template in a single pass
+    replacements = {
+        '<!-- AUTHOR_NAME -->': author_name,
+        ESSAYS_DATA_TAG: f'<script type="application/json" id="essaysData">{embedded_json_data}</script>',
+        'author_name': author_name,
+    }
+    html_with_author = TEMPLATE_PLACEHOLDER_RE.sub(lambda match: replacements[match.group(0)], load_html_template())
+
+    # Write the modified HTML to the remote server
+    html_output_path = os.path.join(settings.REMOTE_HTML_DIR, f'{author_name}.html')
+    success = remote_handler.save_file(html_with_author, html_output_path)
+    if success:
+        print(f"Generated HTML file: {html_output_path}")
+    else:
+        print(f"Failed to generate HTML file: {html_output_path}")
+
+
+class PostListCache:
+    """
+    Remembers the ETag / Last-Modified validators and the post URLs of each sitemap.xml and feed.xml fetched, so an
+    unchanged post list is confirmed with a conditional GET (304, no body) instead of being downloaded and parsed
+    """
+
+    def __init__(self, path: str = HTTP_CACHE_PATH):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        # WAL with synchronous=NORMAL makes a commit an append without an fsync of the main database file
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS post_lists "
+                "(url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, post_urls TEXT NOT NULL)"
+            )
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """
+        Returns the If-None-Match / If-Modified-Since headers for a list fetched before, or {} if it was not
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT etag, last_modified FROM post_lists WHERE url = ?", (url,)).fetchone()
+        headers = {}
+        if row and row[0]:
+            headers["If-None-Match"] = row[0]
+        if row and row[1]:
+            headers["If-Modified-Since"] = row[1]
+        return headers
+
+    def get_post_urls(self, url: str) -> List[str]:
+        """
+        Returns the post URLs stored for a list
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT post_urls FROM post_lists WHERE url = ?", (url,)).fetchone()
+        return row[0].split("\n") if row and row[0] else []
+
+    def store(self, url: str, headers, post_urls: List[str]) -> None:
+        """
+        Stores the post URLs of a freshly downloaded list together with its response validators
+        """
+        etag, last_modified = headers.get("ETag"), headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return  # It could never be revalidated
+        # Committed once in close(), so a sitemap index with many children costs one transaction per run
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO post_lists (url, etag, last_modified, post_urls) VALUES (?, ?, ?, ?)",
+                (url, etag, last_modified, "\n".join(post_urls))
+            )
 
-    # Read JSON data
-    json_path = os.path.join(JSON_DATA_DIR, f'{author_name}.json')
-    with open(json_path, 'r', encoding='utf-8') as file:
-        essays_data = json.load(file)
+    def close(self) -> None:
+        """
+        Commits the lists stored during this run and closes the database
+        """
+        with self._lock:
+            self._conn.commit()
+            self._conn.close()
 
-    # Convert JSON data to a JSON string for embedding
-    embedded_json_data = json.dumps(essays_data, ensure_ascii=False, indent=4)
 
-    with open(HTML_TEMPLATE, 'r', encoding='utf-8') as file:
-        html_template = file.read()
+class RateLimiter:
+    """
+    Spaces calls to wait() at least 1 / rate seconds apart across all threads. A rate of 0 disables limiting.
+    """
 
-    # Insert the JSON string into the script tag in the HTML template
-    html_with_data = html_template.replace('<!-- AUTHOR_NAME -->', author_name).replace(
-        '<script type="application/json" id="essaysData"></script>',
-        f'<script type="application/json" id="essaysData">{embedded_json_data}</script>'
-    )
-    html_with_author = html_with_data.replace('author_name', author_name)
+    def __init__(self, rate: float):
+        self._interval = 1.0 / rate if rate > 0 else 0.0
+        self._lock = threading.Lock()
+        self._next_time = 0.0
+
+    def wait(self) -> None:
+        if not self._interval:
+            return
+        # Reserve the next slot under the lock, then sleep outside it so other threads can reserve theirs
+        with self._lock:
+            now = monotonic()
+            start = max(now, self._next_time)
+            self._next_time = start + self._interval
+        if start > now:
+            sleep(start - now)
+
+
+@dataclass(frozen=True)
+class PostData:
+    """
+    Metadata and markdown extracted from one post page
+    """
+    __slots__ = ("title", "subtitle", "like_count", "date", "md_content")
 
-    # Write the modified HTML to the remote server
-    html_output_path = os.path.join(REMOTE_HTML_DIR, f'{author_name}.html')
-    success = remote_handler.save_file(html_with_author, html_output_path)
-    if success:
-        print(f"Generated HTML file: {html_output_path}")
-    else:
-        print(f"Failed to generate HTML file: {html_output_path}")
+    title: str
+    subtitle: str
+    like_count: str
+    date: str  # As displayed on the post, e.g. "Oct 01, 2024"
+    md_content: str  # Markdown including the metadata header
 
 
 class BaseSubstackScraper(ABC):
-    def __init__(self, base_substack_url: str, md_save_dir: str, html_save_dir: str):
+    # Posts scraped in parallel; subclasses whose fetches share a resource (like one browser) keep this lower
+    max_concurrent_posts: int = MAX_CONCURRENT_POSTS
+
+    def __init__(
+            self,
+            base_substack_url: str,
+            md_save_dir: str,
+            html_save_dir: str,
+            concurrency: Optional[int] = None,
+            image_concurrency: Optional[int] = None,
+            rate_limit: float = 0.0,
+            legacy_markdown: bool = False
+    ):
         if not base_substack_url.endswith("/"):
             base_substack_url += "/"
         self.base_substack_url: str = base_substack_url
@@ -480,7 +1278,10 @@ class BaseSubstackScraper(ABC):
 
         # Initialize remote file handler with fallback
         try:
-            self.remote_handler = RemoteFileHandler(REMOTE_SERVER, REMOTE_USER, REMOTE_BASE_DIR, SSH_KEY_PATH)
+            settings = get_settings()
+            self.remote_handler = RemoteFileHandler(
+                settings.REMOTE_SERVER, settings.REMOTE_USER, settings.REMOTE_BASE_DIR, settings.SSH_KEY_PATH
+            )
             self.use_remote = True
             
             # Test connection before proceeding
@@ -514,9 +1315,47 @@ class BaseSubstackScraper(ABC):
                 os.makedirs(self.html_save_dir)
                 print(f"Created local html directory {self.html_save_dir}")
 
+        self.max_workers: int = concurrency or self.max_concurrent_posts
+        image_workers = image_concurrency or MAX_CONCURRENT_IMAGES
+        self.image_executor = ThreadPoolExecutor(max_workers=image_workers)
+        # Paces post page loads (HTTP or browser) to stay under the site's rate limits
+        self.rate_limiter = RateLimiter(rate_limit)
+        # Local markdown writes overlap with the HTML render and write of the same post
+        self.file_executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        # Image URL -> saved path, so images shared between posts (headers, logos) are only checked once per run
+        self._image_cache: Dict[str, str] = {}
+        self._image_cache_lock = threading.Lock()
+        # Convert post bodies with html2text, as before the built-in converter, instead of element_to_markdown
+        self.legacy_markdown: bool = legacy_markdown
         self.keywords: List[str] = ["about", "archive", "podcast"]
+        # One alternation over all keywords, so each URL is scanned once rather than once per keyword
+        self._skip_re: re.Pattern = re.compile("|".join(re.escape(keyword) for keyword in self.keywords))
+
+        # One pooled session for sitemap, feed, post and image requests, so keep-alive connections are reused
+        self.session: requests.Session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=HTTP_POOL_CONNECTIONS,
+            pool_maxsize=max(HTTP_POOL_MAXSIZE, self.max_workers + image_workers),
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        self.post_list_cache = PostListCache()
+        self._saved_posts_listed: bool = False  # Set by scrape_posts once md_save_dir has been listed
         self.post_urls: List[str] = self.get_all_post_urls()
 
+    def close(self) -> None:
+        """
+        Release the HTTP session and the worker pools
+        """
+        self.image_executor.shutdown(wait=True)
+        self.file_executor.shutdown(wait=True)
+        self.session.close()
+        self.post_list_cache.close()
+        if self.remote_handler is not None:
+            self.remote_handler.close()
+
     def get_all_post_urls(self) -> List[str]:
         """
         Attempts to fetch URLs from sitemap.xml, falling back to feed.xml if necessary.
@@ -524,21 +1363,37 @@ class BaseSubstackScraper(ABC):
         urls = self.fetch_urls_from_sitemap()
         if not urls:
             urls = self.fetch_urls_from_feed()
-        return self.filter_urls(urls, self.keywords)
+        return self.filter_urls(urls)
 
-    def fetch_urls_from_sitemap(self) -> List[str]:
+    def fetch_urls_from_sitemap(self, sitemap_url: Optional[str] = None) -> List[str]:
         """
-        Fetches URLs from sitemap.xml.
+        Fetches URLs from sitemap.xml, following the child sitemaps if it is a sitemap index.
         """
-        sitemap_url = f"{self.base_substack_url}sitemap.xml"
-        response = requests.get(sitemap_url)
-
-        if not response.ok:
-            print(f'Error fetching sitemap at {sitemap_url}: {response.status_code}')
-            return []
-
-        root = ET.fromstring(response.content)
-        urls = [element.text for element in root.iter('{http://www.sitemaps.org/schemas/sitemap/0.9}loc')]
+        sitemap_url = sitemap_url or f"{self.base_substack_url}sitemap.xml"
+        headers = self.post_list_cache.conditional_headers(sitemap_url)
+        with self.session.get(sitemap_url, headers=headers, stream=True, timeout=REQUEST_TIMEOUT) as response:
+            if response.status_code == 304:
+                print('Sitemap unchanged since the last run, reusing its post list.')
+                return self.post_list_cache.get_post_urls(sitemap_url)
+            if not response.ok:
+                print(f'Error fetching sitemap at {sitemap_url}: {response.status_code}')
+                return []
+
+            # Parse straight off the socket and drop each element once read, so the sitemap is never held in memory
+            response.raw.decode_content = True
+            urls, child_sitemaps = [], []
+            for element in iter_xml_elements(response.raw, (SITEMAP_URL_TAG, SITEMAP_CHILD_TAG)):
+                loc = SITEMAP_LOC_XPATH(element)
+                if loc:
+                    (urls if element.tag == SITEMAP_URL_TAG else child_sitemaps).append(loc)
+
+        if child_sitemaps:
+            # An index is small and only points at the real lists, so it is not cached; each child sitemap is
+            for child_sitemap in child_sitemaps:
+                urls.extend(self.fetch_urls_from_sitemap(child_sitemap))
+            return urls
+
+        self.post_list_cache.store(sitemap_url, response.headers, urls)
         return urls
 
     def fetch_urls_from_feed(self) -> List[str]:
@@ -547,27 +1402,27 @@ class BaseSubstackScraper(ABC):
         """
         print('Falling back to feed.xml. This will only contain up to the 22 most recent posts.')
         feed_url = f"{self.base_substack_url}feed.xml"
-        response = requests.get(feed_url)
-
-        if not response.ok:
-            print(f'Error fetching feed at {feed_url}: {response.status_code}')
-            return []
-
-        root = ET.fromstring(response.content)
-        urls = []
-        for item in root.findall('.//item'):
-            link = item.find('link')
-            if link is not None and link.text:
-                urls.append(link.text)
+        headers = self.post_list_cache.conditional_headers(feed_url)
+        with self.session.get(feed_url, headers=headers, stream=True, timeout=REQUEST_TIMEOUT) as response:
+            if response.status_code == 304:
+                print('Feed unchanged since the last run, reusing its post list.')
+                return self.post_list_cache.get_post_urls(feed_url)
+            if not response.ok:
+                print(f'Error fetching feed at {feed_url}: {response.status_code}')
+                return []
+
+            response.raw.decode_content = True
+            urls = [url for url in map(FEED_LINK_XPATH, iter_xml_elements(response.raw, "item")) if url]
+        self.post_list_cache.store(feed_url, response.headers, urls)
 
         return urls
 
-    @staticmethod
-    def filter_urls(urls: List[str], keywords: List[str]) -> List[str]:
+    def filter_urls(self, urls: List[str]) -> List[str]:
         """
-        This method filters out URLs that contain certain keywords
+        This method filters out URLs that contain any of self.keywords
         """
-        return [url for url in urls if all(keyword not in url for keyword in keywords)]
+        skip = self._skip_re.search
+        return [url for url in urls if not skip(url)]
 
     @staticmethod
     def html_to_md(html_content: str) -> str:
@@ -607,8 +1462,7 @@ class BaseSubstackScraper(ABC):
                 print(f"File already exists: {filepath}")
                 return
 
-            with open(filepath, 'w', encoding='utf-8') as file:
-                file.write(content)
+            write_text_file(filepath, content)
             print(f"Saved file locally: {filepath}")
 
     @staticmethod
@@ -616,7 +1470,10 @@ class BaseSubstackScraper(ABC):
         """
         This method converts Markdown to HTML
         """
-        return markdown.markdown(md_content, extensions=['extra'])
+        converter = getattr(_markdown_local, "converter", None)
+        if converter is None:
+            converter = _markdown_local.converter = markdown.Markdown(extensions=['extra'])
+        return converter.reset().convert(md_content)
 
     def create_images_directory(self) -> str:
         """
@@ -641,23 +1498,35 @@ class BaseSubstackScraper(ABC):
         """
         Extracts all image URLs from markdown content
         """
-        # Pattern to match markdown image syntax: ![alt text](url)
-        # This pattern specifically looks for ![...](url) which is markdown image syntax
-        image_pattern = r'!\[[^\]]*\]\((https?://[^\s\)]+)\)'
-        urls = re.findall(image_pattern, markdown_content)
-        return urls
+        return [match.group(2) for match in IMAGE_MARKDOWN_RE.finditer(markdown_content)]
 
     def download_image(self, image_url: str, images_dir: str) -> Optional[str]:
         """
-        Downloads an image from URL and saves it
+        Downloads an image from URL and saves it, reusing the saved path if another post of this run already did
+        Returns the file path if successful, None if failed
+        """
+        with self._image_cache_lock:
+            cached_path = self._image_cache.get(image_url)
+        if cached_path:
+            return cached_path
+
+        file_path = self._fetch_image(image_url, images_dir)
+        if file_path:
+            with self._image_cache_lock:
+                self._image_cache[image_url] = file_path
+        return file_path
+
+    def _fetch_image(self, image_url: str, images_dir: str) -> Optional[str]:
+        """
+        Saves an image under images_dir unless it is already there
         Returns the file path if successful, None if failed
         """
         try:
             # Create a unique filename based on URL hash
-            url_hash = hashlib.md5(image_url.encode()).hexdigest()[:8]
+            url_hash = image_url_hash(image_url)
             
             # Get file extension from URL or default to .jpg
-            parsed_url = urlparse(image_url)
+            parsed_url = cached_urlparse(image_url)
             path = parsed_url.path
             if '.' in path:
                 ext = os.path.splitext(path)[1]
@@ -682,53 +1551,42 @@ class BaseSubstackScraper(ABC):
                 if os.path.exists(file_path):
                     return file_path
             
-            # Download the image
+            # Download the image; leaving the with block releases the streamed connection on every path
             try:
                 # print(f"[DEBUG] Downloading image: {image_url}")
-                response = requests.get(image_url, stream=True, timeout=30)
-                response.raise_for_status()
-                # print(f"[DEBUG] Image download successful, size: {len(response.content)} bytes")
+                with self.session.get(image_url, stream=True, timeout=REQUEST_TIMEOUT) as response:
+                    response.raise_for_status()
+                    # print(f"[DEBUG] Image download successful, size: {len(response.content)} bytes")
+
+                    if self.use_remote:
+                        # Stream the download straight into the remote file, without a temporary local file
+                        try:
+                            chunks = response.iter_content(chunk_size=IMAGE_CHUNK_SIZE)
+                            if self.remote_handler.save_stream(chunks, file_path):
+                                print(f"[OK] Image uploaded successfully: {file_path}")
+                                return file_path
+                            else:
+                                print(f"[ERROR] Failed to upload image {image_url}")
+                                return None
+                        except Exception as e:
+                            print(f"[ERROR] Error processing image {image_url}: {e}")
+                            return None
+                    else:
+                        # Save directly to local file, copying from the raw stream in C without a Python-level
+                        # chunk loop
+                        try:
+                            response.raw.decode_content = True  # Undo any Content-Encoding, as iter_content would
+                            with open(file_path, 'wb') as f:
+                                shutil.copyfileobj(response.raw, f, length=IMAGE_COPY_SIZE)
+                            print(f"[OK] Image saved locally: {file_path}")
+                            return file_path
+                        except Exception as e:
+                            print(f"[ERROR] Failed to save image locally {image_url}: {e}")
+                            return None
             except requests.exceptions.RequestException as e:
                 # print(f"[ERROR] Failed to download image {image_url}: {e}")
                 return None
             
-            if self.use_remote:
-                # Save to temporary local file first, then upload
-                try:
-                    with tempfile.NamedTemporaryFile(delete=False, suffix=ext) as temp_file:
-                        for chunk in response.iter_content(chunk_size=8192):
-                            temp_file.write(chunk)
-                        temp_local_path = temp_file.name
-                    
-                    # print(f"[DEBUG] Temporary file created: {temp_local_path}")
-                    
-                    # Copy the image to the remote server
-                    success, output = self.remote_handler._run_scp_command(temp_local_path, file_path)
-                    if success:
-                        print(f"[OK] Image uploaded successfully: {file_path}")
-                        return file_path
-                    else:
-                        print(f"[ERROR] Failed to upload image {image_url}: {output}")
-                        return None
-                except Exception as e:
-                    print(f"[ERROR] Error processing image {image_url}: {e}")
-                    return None
-                finally:
-                    # Clean up the temporary file
-                    if 'temp_local_path' in locals() and os.path.exists(temp_local_path):
-                        os.unlink(temp_local_path)
-            else:
-                # Save directly to local file
-                try:
-                    with open(file_path, 'wb') as f:
-                        for chunk in response.iter_content(chunk_size=8192):
-                            f.write(chunk)
-                    print(f"[OK] Image saved locally: {file_path}")
-                    return file_path
-                except Exception as e:
-                    print(f"[ERROR] Failed to save image locally {image_url}: {e}")
-                    return None
-            
         except Exception as e:
             print(f"Failed to download image {image_url}: {e}")
             return None
@@ -737,21 +1595,37 @@ class BaseSubstackScraper(ABC):
         """
         Replaces image URLs in markdown content with relative remote paths
         """
-        image_urls = self.extract_image_urls_from_markdown(markdown_content)
+        # Download every distinct image of the post in parallel on the shared image pool
+        image_urls = list(dict.fromkeys(self.extract_image_urls_from_markdown(markdown_content)))
+        remote_paths = self.image_executor.map(lambda url: self.download_image(url, images_dir), image_urls)
         
-        for image_url in image_urls:
-            remote_path = self.download_image(image_url, images_dir)
+        relative_paths = {}
+        for image_url, remote_path in zip(image_urls, remote_paths):
             if remote_path:
                 # Calculate relative path from markdown file to image
                 relative_path = os.path.relpath(remote_path, self.md_save_dir)
                 # Ensure forward slashes for markdown compatibility
-                relative_path = relative_path.replace("\\", "/")
-                
-                # Replace the URL in markdown content
-                markdown_content = markdown_content.replace(image_url, relative_path)
-        
-        return markdown_content
+                relative_paths[image_url] = relative_path.replace("\\", "/")
 
+        if not relative_paths:
+            return markdown_content
+
+        # Rewrite all image URLs in a single pass over the markdown
+        return IMAGE_MARKDOWN_RE.sub(
+            lambda match: match.group(1) + relative_paths.get(match.group(2), match.group(2)) + match.group(3),
+            markdown_content
+        )
+
+
+    @staticmethod
+    def html_page_parts(filepath: str, content: str) -> Tuple[bytes, bytes, bytes]:
+        """
+        Returns the encoded head, content and tail of the page wrapping converted post HTML, linking the stylesheet
+        relative to filepath. The head and tail are shared by every page in the same directory.
+        """
+        # Calculate the relative path from the HTML file to the CSS file
+        head, tail = html_wrapper_parts(get_css_path(os.path.dirname(filepath)))
+        return head, content.encode('utf-8'), tail
 
     def save_to_html_file(self, filepath: str, content: str) -> None:
         """
@@ -763,37 +1637,17 @@ class BaseSubstackScraper(ABC):
         if not isinstance(content, str):
             raise ValueError("content must be a string")
 
-        # Calculate the relative path from the HTML file to the CSS file
-        html_dir = os.path.dirname(filepath)
-        css_path = os.path.relpath("./assets/css/essay-styles.css", html_dir)
-        css_path = css_path.replace("\\", "/")  # Ensure forward slashes for web paths
-
-        html_content = f"""
-            <!DOCTYPE html>
-            <html lang="en">
-            <head>
-                <meta charset="UTF-8">
-                <meta name="viewport" content="width=device-width, initial-scale=1.0">
-                <title>Markdown Content</title>
-                <link rel="stylesheet" href="{css_path}">
-            </head>
-            <body>
-                <main class="markdown-content">
-                {content}
-                </main>
-            </body>
-            </html>
-        """
+        page_parts = self.html_page_parts(filepath, content)
 
         if self.use_remote:
-            success = self.remote_handler.save_file(html_content, filepath)
+            success = self.remote_handler.save_file(b"".join(page_parts), filepath)
             if success:
                 print(f"Saved HTML file: {filepath}")
             else:
                 print(f"Failed to save HTML file: {filepath}")
         else:
-            with open(filepath, 'w', encoding='utf-8') as file:
-                file.write(html_content)
+            with open(filepath, 'wb') as file:
+                file.writelines(page_parts)
             print(f"Saved HTML file locally: {filepath}")
 
     @staticmethod
@@ -810,15 +1664,25 @@ class BaseSubstackScraper(ABC):
         if not filetype.startswith("."):
             filetype = f".{filetype}"
 
+        return BaseSubstackScraper.build_filename(url, filetype, BaseSubstackScraper.get_filename_date(date))
+
+    @staticmethod
+    def get_filename_date(date: str) -> str:
+        """
+        Returns the YYYY-MM-DD filename prefix for a post date, or "" if the date could not be parsed
+        """
+        if not date:
+            return ""
+        parsed_date = parse_date_to_iso(date)
+        return parsed_date if parsed_date and parsed_date != date else ""  # Only use if parsing was successful
+
+    @staticmethod
+    def build_filename(url: str, filetype: str, iso_date: str) -> str:
+        """
+        Joins an already parsed date prefix, the URL ending and the file type, without parsing the date again
+        """
         base_filename = url.split("/")[-1]
-        
-        # If date is provided, prepend it to the filename
-        if date:
-            parsed_date = parse_date_to_iso(date)
-            if parsed_date and parsed_date != date:  # Only use if parsing was successful
-                return f"{parsed_date}_{base_filename}{filetype}"
-        
-        return base_filename + filetype
+        return f"{iso_date}_{base_filename}{filetype}" if iso_date else base_filename + filetype
 
     @staticmethod
     def combine_metadata_and_content(title: str, subtitle: str, date: str, like_count: str, content) -> str:
@@ -839,41 +1703,54 @@ class BaseSubstackScraper(ABC):
 
         return metadata + content
 
-    def extract_post_data(self, soup: BeautifulSoup) -> Tuple[str, str, str, str, str]:
+    def extract_post_data(self, soup: BeautifulSoup) -> PostData:
         """
         Converts substack post soup to markdown, returns metadata and content
         """
-        title = soup.select_one("h1.post-title, h2").text.strip()  # When a video is present, the title is demoted to h2
+        title = POST_TITLE_SELECTOR.select_one(soup).text.strip()
 
-        subtitle_element = soup.select_one("h3.subtitle")
+        subtitle_element = POST_SUBTITLE_SELECTOR.select_one(soup)
         subtitle = subtitle_element.text.strip() if subtitle_element else ""
 
-        
-        date_element = soup.find(
-            "div",
-            class_="pencraft pc-reset color-pub-secondary-text-hGQ02T line-height-20-t4M0El font-meta-MWBumP size-11-NuY2Zx weight-medium-fw81nC transform-uppercase-yKDgcq reset-IxiVJZ meta-EgzBVA"
-        )
+        date_element = POST_DATE_SELECTOR.select_one(soup)
         date = date_element.text.strip() if date_element else "Date not found"
 
-        like_count_element = soup.select_one("a.post-ufi-button .label")
-        like_count = (
-            like_count_element.text.strip()
-            if like_count_element and like_count_element.text.strip().isdigit()
-            else "0"
-        )
-
-        content = str(soup.select_one("div.available-content"))
-        md = self.html_to_md(content)
+        like_count_element = POST_LIKE_COUNT_SELECTOR.select_one(soup)
+        like_count = like_count_element.text.strip() if like_count_element else ""
+        if not like_count.isdigit():
+            like_count = "0"
+
+        content_element = POST_CONTENT_SELECTOR.select_one(soup)
+        if self.legacy_markdown:
+            if content_element is not None:
+                # html2text outputs nothing for these, so drop them rather than serialize and re-parse them
+                for element in POST_UNRENDERED_SELECTOR.select(content_element):
+                    element.decompose()
+            md = self.html_to_md(str(content_element))
+        else:
+            # Converted straight from the parsed tree, which skips unrendered elements itself
+            md = element_to_markdown(content_element)
         md_content = self.combine_metadata_and_content(title, subtitle, date, like_count, md)
-        return title, subtitle, like_count, date, md_content
+        return PostData(title, subtitle, like_count, date, md_content)
+
+    @staticmethod
+    def make_soup(markup: Union[str, bytes]) -> BeautifulSoup:
+        """
+        Parses a post page with lxml, building only the subtrees extract_post_data needs (POST_PAGE_STRAINER)
+        """
+        if isinstance(markup, bytes):
+            # Substack pages are always UTF-8; naming it skips bs4's encoding detection on the raw bytes
+            return BeautifulSoup(markup, "lxml", from_encoding="utf-8", parse_only=POST_PAGE_STRAINER)
+        # Already decoded (e.g. driver.page_source), so it goes to lxml without an encode/decode round trip
+        return BeautifulSoup(markup, "lxml", parse_only=POST_PAGE_STRAINER)
 
     @abstractmethod
     def get_url_soup(self, url: str) -> str:
         raise NotImplementedError
 
-    def save_essays_data_to_json(self, essays_data: list) -> None:
+    def save_essays_data_to_json(self, essays_data: list) -> str:
         """
-        Saves essays data to a JSON file for a specific author.
+        Saves essays data to a JSON file for a specific author and returns the JSON text written.
         Note: JSON data is stored locally, but file paths in the JSON point to remote locations.
         """
         data_dir = os.path.join(JSON_DATA_DIR)
@@ -883,91 +1760,207 @@ class BaseSubstackScraper(ABC):
         json_path = os.path.join(data_dir, f'{self.writer_name}.json')
         if os.path.exists(json_path):
             with open(json_path, 'r', encoding='utf-8') as file:
-                existing_data = json.load(file)
-            essays_data = existing_data + [data for data in essays_data if data not in existing_data]
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(essays_data, f, ensure_ascii=False, indent=4)
+                existing_json = file.read()
+            if not essays_data:
+                return existing_json  # Nothing new this run, so the file is left as it is
+            existing_data = json.loads(existing_json)
+            # Posts are identified by their markdown path, so dedupe on it with a set instead of comparing dicts
+            seen_links = {data["file_link"] for data in existing_data}
+            new_data = [data for data in essays_data if data["file_link"] not in seen_links]
+            if not new_data:
+                return existing_json
+            if existing_data and existing_json.endswith("\n]"):
+                # Only the new essays are encoded; spliced in before the closing bracket, they give the same text as
+                # encoding the whole list again
+                new_json = json.dumps(new_data, ensure_ascii=False, indent=4)
+                essays_json = f"{existing_json[:-2]},\n{new_json[2:]}"
+                write_text_file(json_path, essays_json)
+                return essays_json
+            essays_data = existing_data + new_data
+        # dumps() encodes in one C call; dump() would hand the file thousands of small chunks
+        essays_json = json.dumps(essays_data, ensure_ascii=False, indent=4)
+        write_text_file(json_path, essays_json)
+        return essays_json
+
+    def get_existing_post_slugs(self) -> Optional[Set[str]]:
+        """
+        Returns the slugs of posts that already have a markdown file in md_save_dir, read with a single listing,
+        or None if the directory could not be listed
+        """
+        if self.use_remote:
+            filenames = self.remote_handler.existing_files(self.md_save_dir)
+        else:
+            try:
+                # One getdents pass; the names are all that is needed, so no entry is stat'ed
+                with os.scandir(self.md_save_dir) as entries:
+                    filenames = [entry.name for entry in entries]
+            except FileNotFoundError:
+                filenames = []
+            except OSError:
+                filenames = None
+        if filenames is None:
+            return None
+        return {DATED_FILENAME_RE.sub('', filename[:-3]) for filename in filenames if filename.endswith(".md")}
+
+    def scrape_post(self, url: str, images_dir: str) -> Tuple[bool, Optional[dict]]:
+        """
+        Scrapes a single post and saves it as markdown and html files.
+        Returns (counted, essay_data): counted is False when the post was skipped (e.g. paywalled) and should not
+        count towards num_posts_to_scrape; essay_data is None unless a new post was saved.
+        """
+        try:
+            # First get the post data to extract the date
+            soup = self.get_url_soup(url)
+            if soup is None:
+                return False, None
+            
+            post = self.extract_post_data(soup)
+            # The parse tree is a web of parent/child reference cycles that only the cyclic GC would reclaim; tear it
+            # down now rather than keep it alive through the image downloads and writes below
+            soup.decompose()
+            del soup
+            
+            # Generate filenames with date prefix
+            # Parse the date once and share the prefix between both filenames
+            iso_date = self.get_filename_date(post.date)
+            md_filename = self.build_filename(url, ".md", iso_date)
+            html_filename = self.build_filename(url, ".html", iso_date)
+            
+            if self.use_remote:
+                # For remote, use forward slashes
+                md_filepath = f"{self.md_save_dir}/{md_filename}"
+                html_filepath = f"{self.html_save_dir}/{html_filename}"
+            else:
+                # For local, use os.path.join
+                md_filepath = os.path.join(self.md_save_dir, md_filename)
+                html_filepath = os.path.join(self.html_save_dir, html_filename)
+
+            file_exists = False
+            if self._saved_posts_listed:
+                pass  # scrape_posts only starts posts that were not in the listing of md_save_dir
+            elif self.use_remote:
+                file_exists = self.remote_handler.file_exists(md_filepath)
+            else:
+                file_exists = os.path.exists(md_filepath)
+            
+            if file_exists:
+                print(f"File already exists: {md_filepath}")
+                return True, None
+
+            # Download images and replace URLs in markdown, only now that the post is known to be new
+            md = self.replace_image_urls_in_markdown(post.md_content, images_dir)
+
+            if self.use_remote:
+                # Upload the markdown and HTML of the post together, so the two round trips overlap
+                html_content = b"".join(self.html_page_parts(html_filepath, self.md_to_html(md)))
+                saved = self.remote_handler.save_many([(md_filepath, md), (html_filepath, html_content)])
+                for filepath, success in zip((md_filepath, html_filepath), saved):
+                    print(f"Saved file: {filepath}" if success else f"Failed to save file: {filepath}")
+            else:
+                # Write the markdown in the background while the HTML is rendered and written on this thread
+                md_saved = self.file_executor.submit(self.save_to_file, md_filepath, md)
+
+                # Convert markdown to HTML and save
+                html_content = self.md_to_html(md)
+                self.save_to_html_file(html_filepath, html_content)
+                md_saved.result()
+
+            return True, {
+                "title": post.title,
+                "subtitle": post.subtitle,
+                "like_count": post.like_count,
+                "date": post.date,
+                "file_link": md_filepath,
+                "html_link": html_filepath
+            }
+        except Exception as e:
+            print(f"Error scraping post: {e}")
+            return True, None
 
     def scrape_posts(self, num_posts_to_scrape: int = 0) -> None:
         """
-        Iterates over all posts and saves them as markdown and html files
+        Iterates over all posts and saves them as markdown and html files.
+        Up to self.max_workers posts are scraped concurrently; no more posts are started than are still needed.
         """
-        essays_data = []
+        essays_by_index = {}
         count = 0
         total = num_posts_to_scrape if num_posts_to_scrape != 0 else len(self.post_urls)
         
         # Create images directory
         images_dir = self.create_images_directory()
         
-        for url in tqdm(self.post_urls, total=total):
-            try:
-                # First get the post data to extract the date
-                soup = self.get_url_soup(url)
-                if soup is None:
-                    total += 1
-                    continue
-                
-                title, subtitle, like_count, date, md = self.extract_post_data(soup)
-                
-                # Download images and replace URLs in markdown
-                md = self.replace_image_urls_in_markdown(md, images_dir)
-                
-                # Generate filenames with date prefix
-                md_filename = self.get_filename_from_url(url, filetype=".md", date=date)
-                html_filename = self.get_filename_from_url(url, filetype=".html", date=date)
-                
-                if self.use_remote:
-                    # For remote, use forward slashes
-                    md_filepath = f"{self.md_save_dir}/{md_filename}"
-                    html_filepath = f"{self.html_save_dir}/{html_filename}"
-                else:
-                    # For local, use os.path.join
-                    md_filepath = os.path.join(self.md_save_dir, md_filename)
-                    html_filepath = os.path.join(self.html_save_dir, html_filename)
+        # Already-saved posts are skipped without fetching them, but still count towards num_posts_to_scrape.
+        # When the listing worked, any other post is known to be new and scrape_post skips its own existence check.
+        existing_slugs = self.get_existing_post_slugs()
+        self._saved_posts_listed = existing_slugs is not None
+        existing_slugs = existing_slugs or set()
+        pending_urls = iter(enumerate(self.post_urls))
+        in_flight = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor, tqdm(total=total) as progress:
+            while True:
+                # Keep the pool full, but never start more posts than are still needed
+                while len(in_flight) < self.max_workers and (
+                        num_posts_to_scrape == 0 or count + len(in_flight) < num_posts_to_scrape
+                ):
+                    next_url = next(pending_urls, None)
+                    if next_url is None:
+                        break
+                    index, url = next_url
+                    if url.split("/")[-1] in existing_slugs:
+                        count += 1
+                        progress.update(1)
+                        continue
+                    in_flight[executor.submit(self.scrape_post, url, images_dir)] = index
 
-                file_exists = False
-                if self.use_remote:
-                    file_exists = self.remote_handler.file_exists(md_filepath)
-                else:
-                    file_exists = os.path.exists(md_filepath)
-                
-                if not file_exists:
-                    self.save_to_file(md_filepath, md)
-
-                    # Convert markdown to HTML and save
-                    html_content = self.md_to_html(md)
-                    self.save_to_html_file(html_filepath, html_content)
-
-                    essays_data.append({
-                        "title": title,
-                        "subtitle": subtitle,
-                        "like_count": like_count,
-                        "date": date,
-                        "file_link": md_filepath,
-                        "html_link": html_filepath
-                    })
-                else:
-                    print(f"File already exists: {md_filepath}")
-            except Exception as e:
-                print(f"Error scraping post: {e}")
-            count += 1
-            if num_posts_to_scrape != 0 and count == num_posts_to_scrape:
-                break
-        self.save_essays_data_to_json(essays_data=essays_data)
-        generate_html_file(author_name=self.writer_name)
+                if not in_flight:
+                    break
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = in_flight.pop(future)
+                    counted, essay_data = future.result()
+                    if counted:
+                        count += 1
+                    else:
+                        progress.total += 1
+                    if essay_data:
+                        essays_by_index[index] = essay_data
+                    progress.update(1)
+
+        # Keep the sitemap order regardless of which post finished first
+        essays_data = [essays_by_index[index] for index in sorted(essays_by_index)]
+        essays_json = self.save_essays_data_to_json(essays_data=essays_data)
+        generate_html_file(
+            author_name=self.writer_name, embedded_json_data=essays_json, remote_handler=self.remote_handler
+        )
 
 
 class SubstackScraper(BaseSubstackScraper):
-    def __init__(self, base_substack_url: str, md_save_dir: str, html_save_dir: str):
-        super().__init__(base_substack_url, md_save_dir, html_save_dir)
+    # Fetches are independent HTTP requests on the pooled session, so many more can be waiting on the network at once
+    max_concurrent_posts: int = MAX_CONCURRENT_HTTP_POSTS
+
+    def __init__(
+            self,
+            base_substack_url: str,
+            md_save_dir: str,
+            html_save_dir: str,
+            concurrency: Optional[int] = None,
+            image_concurrency: Optional[int] = None,
+            rate_limit: float = 0.0,
+            legacy_markdown: bool = False
+    ):
+        super().__init__(
+            base_substack_url, md_save_dir, html_save_dir, concurrency, image_concurrency, rate_limit, legacy_markdown
+        )
 
     def get_url_soup(self, url: str) -> Optional[BeautifulSoup]:
         """
         Gets soup from URL using requests
         """
         try:
-            page = requests.get(url, headers=None)
-            soup = BeautifulSoup(page.content, "html.parser")
+            self.rate_limiter.wait()
+            page = self.session.get(url, timeout=REQUEST_TIMEOUT)
+            soup = self.make_soup(page.content)
             if soup.find("h2", class_="paywall-title"):
                 print(f"Skipping premium article: {url}")
                 return None
@@ -985,11 +1978,83 @@ class PremiumSubstackScraper(BaseSubstackScraper):
             headless: bool = False,
             chrome_path: str = '',
             chrome_driver_path: str = '',
-            user_agent: str = ''
+            user_agent: str = '',
+            driver: Optional[webdriver.Chrome] = None,
+            browsers: int = 1,
+            concurrency: Optional[int] = None,
+            image_concurrency: Optional[int] = None,
+            rate_limit: float = 0.0,
+            legacy_markdown: bool = False
     ) -> None:
-        super().__init__(base_substack_url, md_save_dir, html_save_dir)
+        super().__init__(
+            base_substack_url, md_save_dir, html_save_dir, concurrency, image_concurrency, rate_limit, legacy_markdown
+        )
+
+        # Each thread uses the browser it checked out of the pool; see the driver property
+        self._local = threading.local()
+        self._drivers: List[webdriver.Chrome] = []
+        self._drivers_lock = threading.Lock()
+        self._driver_pool: "queue.Queue[webdriver.Chrome]" = queue.Queue()
+        self._debugging_ports = itertools.count(REMOTE_DEBUGGING_PORT)
+
+        # An existing driver can be passed in to reuse its browser process; otherwise `browsers` browsers are
+        # started here and owned (restarted if their session dies, quit by close()) by this scraper
+        self._owns_driver: bool = driver is None
+        if self._owns_driver:
+            self._driver_options, self._driver_service = self.build_driver_config(
+                headless, chrome_path, chrome_driver_path, user_agent
+            )
+
+        try:
+            for _ in range(max(browsers, 1) if self._owns_driver else 1):
+                self.driver = driver if driver is not None else self.start_driver()
+                # Tracked before logging in, so close() quits it too if the login fails
+                self._drivers.append(self.driver)
+                # Every browser has its own cookie jar, so each one logs in
+                self.login()
+                # Blocked only after login, so a captcha that has to be solved by hand can still load its images
+                self.block_unneeded_resources()
+                self._driver_pool.put(self.driver)
+
+            # Posts are fetched through the post API with the login cookies where possible; see get_api_soup
+            self._use_post_api: bool = True
+            self.copy_browser_cookies(self._drivers[0])
+        except BaseException:
+            # main() only closes a scraper that was constructed, so release the browsers and pools here
+            self.close()
+            raise
+        self.driver = None
+
+    @property
+    def driver(self) -> webdriver.Chrome:
+        """
+        The browser used by the current thread: the one it checked out of the pool, otherwise the first browser
+        """
+        return getattr(self._local, "driver", None) or self._drivers[0]
+
+    @driver.setter
+    def driver(self, driver: Optional[webdriver.Chrome]) -> None:
+        self._local.driver = driver
 
+    def start_driver(self) -> webdriver.Chrome:
+        """
+        Start a new browser. Each one gets its own DevTools port and ChromeDriver process, so several can run at once.
+        """
+        options = copy.deepcopy(self._driver_options)
+        options.add_argument(f"--remote-debugging-port={next(self._debugging_ports)}")
+        service = Service(executable_path=self._driver_service.path or None)
+        return webdriver.Chrome(service=service, options=options)
+
+    @staticmethod
+    def build_driver_config(
+            headless: bool, chrome_path: str, chrome_driver_path: str, user_agent: str
+    ) -> Tuple[ChromeOptions, Service]:
+        """
+        Finds the browser and ChromeDriver, and returns the options and service to start the driver with
+        """
         options = ChromeOptions()
+        # Return from driver.get() at DOMContentLoaded instead of waiting for every subresource
+        options.page_load_strategy = "eager"
         if headless:
             options.add_argument("--headless")
         
@@ -999,26 +2064,11 @@ class PremiumSubstackScraper(BaseSubstackScraper):
             options.binary_location = chrome_path
         else:
             # Try to find Chrome for Testing (used by Selenium Manager) first
-            cache_path = os.path.expanduser("~/.cache/selenium/chrome")
-            chrome_for_testing_found = False
-            if os.path.exists(cache_path):
-                # Look for Chrome for Testing in cache
-                for root, dirs, files in os.walk(cache_path):
-                    for d in dirs:
-                        if platform.system() == "Darwin":  # macOS
-                            test_path = os.path.join(root, d, "Google Chrome for Testing.app/Contents/MacOS/Google Chrome for Testing")
-                        elif platform.system() == "Windows":
-                            test_path = os.path.join(root, d, "chrome.exe")
-                        else:  # Linux
-                            test_path = os.path.join(root, d, "chrome")
-                        
-                        if os.path.exists(test_path):
-                            options.binary_location = test_path
-                            print(f"Found Chrome for Testing at: {test_path}")
-                            chrome_for_testing_found = True
-                            break
-                    if chrome_for_testing_found:
-                        break
+            test_path = find_chrome_for_testing()
+            chrome_for_testing_found = test_path is not None
+            if chrome_for_testing_found:
+                options.binary_location = test_path
+                print(f"Found Chrome for Testing at: {test_path}")
             
             # If Chrome for Testing not found, try standard locations
             if not chrome_for_testing_found:
@@ -1068,7 +2118,6 @@ class PremiumSubstackScraper(BaseSubstackScraper):
         options.add_argument("--no-sandbox")
         options.add_argument("--disable-dev-shm-usage")
         options.add_argument("--disable-gpu")
-        options.add_argument("--remote-debugging-port=9222")
 
         # Use webdriver-manager or Selenium Manager to automatically download ChromeDriver
         if chrome_driver_path:
@@ -1100,30 +2149,72 @@ class PremiumSubstackScraper(BaseSubstackScraper):
                 print(f"webdriver-manager had issues ({type(e).__name__}), using Selenium Manager instead")
                 service = Service()
 
-        self.driver = webdriver.Chrome(service=service, options=options)
+        return options, service
+
+    def restart_driver(self) -> None:
+        """
+        Replace a driver whose browser session was lost with a fresh, logged in one
+        """
+        print("[WARNING] Browser session lost, restarting the browser...")
+        old_driver = self.driver
+        try:
+            old_driver.quit()
+        except Exception:
+            pass  # The old browser is already gone
+        self.driver = self.start_driver()
+        with self._drivers_lock:
+            self._drivers[self._drivers.index(old_driver)] = self.driver
         self.login()
+        self.block_unneeded_resources()
+
+    def close(self) -> None:
+        """
+        Quit the browsers, if this scraper started them, and release the HTTP session and worker pools
+        """
+        if self._owns_driver:
+            for driver in self._drivers:
+                driver.quit()
+        super().close()
+
+    def block_unneeded_resources(self) -> None:
+        """
+        Stop the browser from fetching images, fonts and trackers through the Chrome DevTools Protocol
+        """
+        try:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(BLOCKED_URL_PATTERNS)})
+        except Exception as e:
+            print(f"[WARNING] Could not block page resources, pages will load in full: {e}")
 
     def login(self) -> None:
         """
         This method logs into Substack using Selenium
         """
+        substack_email, substack_password = require_credentials()
+
         print("Starting login process...")
         self.driver.get("https://substack.com/sign-in")
-        sleep(5)
+        # Wait for the sign-in form to render rather than a fixed delay
+        try:
+            WebDriverWait(self.driver, PAGE_LOAD_TIMEOUT).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, "a.login-option, input[name='email']"))
+            )
+        except TimeoutException:
+            print("[WARNING] Sign-in form did not appear in time, trying anyway")
 
         try:
             signin_with_password = self.driver.find_element(
                 By.XPATH, "//a[@class='login-option substack-login__login-option']"
             )
             signin_with_password.click()
-            sleep(3)
+            self.wait_for_password_field()
         except Exception as e:
             print(f"Could not find sign-in with password option: {e}")
             # Try alternative selectors
             try:
                 signin_with_password = self.driver.find_element(By.XPATH, "//button[contains(text(), 'Sign in with password')]")
                 signin_with_password.click()
-                sleep(3)
+                self.wait_for_password_field()
             except:
                 print("Proceeding with current page...")
 
@@ -1131,48 +2222,30 @@ class PremiumSubstackScraper(BaseSubstackScraper):
         email = self.driver.find_element(By.NAME, "email")
         password = self.driver.find_element(By.NAME, "password")
         email.clear()
-        email.send_keys(EMAIL)
+        email.send_keys(substack_email)
         password.clear()
-        password.send_keys(PASSWORD)
+        password.send_keys(substack_password)
 
         # Find the submit button and click it.
         submit = self.driver.find_element(By.XPATH, "//*[@id=\"substack-login\"]/div[2]/div[2]/form/button")
         submit.click()
         print("Login submitted, waiting for verification...")
-        sleep(5)  # Wait for initial response
         
         # Wait for potential captcha completion and manual intervention
         print("[WAITING] Waiting for login process to complete...")
         print("If you see a captcha, popup, or need to click login, please handle it now.")
         
-        # Wait for successful login
-        max_wait = 60  # Maximum wait time in seconds
-        wait_time = 0
-        login_successful = False
-        
-        while wait_time < max_wait:
-            try:
-                current_url = self.driver.current_url
-                print(f"Current URL: {current_url}")
-                
-                # Check if we've left the sign-in page
-                if "substack.com" in current_url and "sign-in" not in current_url:
-                    print("[OK] Login successful")
-                    login_successful = True
-                    break
-                
-                # Check for error messages
-                error_elements = self.driver.find_elements(By.XPATH, "//*[contains(@class, 'error') or contains(text(), 'Invalid')]")
-                if error_elements:
-                    print(f"[ERROR] Login error: {[e.text for e in error_elements if e.text]}")
-                    
-            except Exception as e:
-                print(f"Error checking login status: {e}")
-            
-            sleep(10)
-            wait_time += 10
-            
-        if not login_successful:
+        # Wait for successful login, returning as soon as we've left the sign-in page
+        try:
+            WebDriverWait(self.driver, LOGIN_TIMEOUT).until(
+                lambda driver: "substack.com" in driver.current_url and "sign-in" not in driver.current_url
+            )
+            print(f"[OK] Login successful, current URL: {self.driver.current_url}")
+        except TimeoutException:
+            # Check for error messages
+            error_elements = self.driver.find_elements(By.XPATH, "//*[contains(@class, 'error') or contains(text(), 'Invalid')]")
+            if error_elements:
+                print(f"[ERROR] Login error: {[e.text for e in error_elements if e.text]}")
             print("[WARNING] Login verification timeout - proceeding anyway")
 
         if self.is_login_failed():
@@ -1184,6 +2257,29 @@ class PremiumSubstackScraper(BaseSubstackScraper):
         
         print("Login process completed.")
 
+    def wait_for_password_field(self) -> None:
+        """
+        Wait until the password input of the sign-in form is shown after choosing password login
+        """
+        try:
+            WebDriverWait(self.driver, PAGE_LOAD_TIMEOUT).until(
+                EC.visibility_of_element_located((By.NAME, "password"))
+            )
+        except TimeoutException:
+            pass  # find_element below reports the missing field
+
+    def wait_for_click_to_settle(self, element) -> None:
+        """
+        Wait briefly until a clicked element is gone from the page (navigated away or closed), at most
+        CLICK_SETTLE_TIMEOUT seconds
+        """
+        try:
+            WebDriverWait(self.driver, CLICK_SETTLE_TIMEOUT).until(
+                lambda driver: EC.staleness_of(element)(driver) or not element.is_displayed()
+            )
+        except Exception:
+            pass  # Still there, e.g. the click opened a modal; carry on as after the old fixed sleep
+
     def close_popups(self) -> None:
         """
         Close any popups or modals that might be blocking the interface
@@ -1207,7 +2303,7 @@ class PremiumSubstackScraper(BaseSubstackScraper):
                     if button.is_displayed() and button.is_enabled():
                         print("[ACTION] Closing popup/modal...")
                         button.click()
-                        sleep(2)
+                        self.wait_for_click_to_settle(button)
                         return
                         
         except Exception as e:
@@ -1233,7 +2329,7 @@ class PremiumSubstackScraper(BaseSubstackScraper):
                     if button.is_displayed() and button.is_enabled():
                         print("[ACTION] Clicking login button...")
                         button.click()
-                        sleep(3)
+                        self.wait_for_click_to_settle(button)
                         return
                         
         except Exception as e:
@@ -1247,23 +2343,111 @@ class PremiumSubstackScraper(BaseSubstackScraper):
         error_container = self.driver.find_elements(By.ID, 'error-container')
         return len(error_container) > 0 and error_container[0].is_displayed()
 
+    def wait_for_post_content(self) -> None:
+        """
+        Wait until the post body (or the paywall in its place) is in the DOM, returning as soon as it appears rather
+        than after a fixed sleep
+        """
+        try:
+            WebDriverWait(self.driver, PAGE_LOAD_TIMEOUT).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, "div.available-content, h2.paywall-title"))
+            )
+        except TimeoutException:
+            print(f"[WARNING] Post content did not appear within {PAGE_LOAD_TIMEOUT}s, using the page as loaded")
+
+    def copy_browser_cookies(self, driver: webdriver.Chrome) -> None:
+        """
+        Copy a logged-in browser's cookies into the HTTP session, so requests are made as the subscriber
+        """
+        for cookie in driver.get_cookies():
+            self.session.cookies.set(
+                cookie["name"], cookie["value"], domain=cookie.get("domain", ""), path=cookie.get("path", "/")
+            )
+
+    def get_api_soup(self, url: str) -> Optional[BeautifulSoup]:
+        """
+        Gets soup for a post from Substack's post API over the logged-in HTTP session, without a browser.
+        Returns None if the API does not return the full post, in which case the page is loaded in a browser.
+        """
+        if not self._use_post_api:
+            return None
+        slug = cached_urlparse(url).path.rstrip("/").rsplit("/", 1)[-1]
+        try:
+            self.rate_limiter.wait()
+            response = self.session.get(f"{self.base_substack_url}{POST_API_PATH}{slug}", timeout=REQUEST_TIMEOUT)
+            if response.status_code in (401, 403):
+                # The cookies are not accepted here (e.g. a custom domain), so stop trying for the rest of the run
+                print("[WARNING] Post API rejected the login cookies, loading posts in the browser instead")
+                self._use_post_api = False
+                return None
+            if response.status_code != 200:
+                return None
+            post = response.json()
+        except (requests.exceptions.RequestException, ValueError):
+            return None
+
+        if not isinstance(post, dict) or not post.get("body_html"):
+            return None
+        soup = self.make_soup(render_api_post(post))
+        if post.get("audience") not in POST_API_FREE_AUDIENCES and not self.is_full_api_body(post, soup):
+            return None  # Only the preview; the browser path handles the page, including its login button
+        return soup
+
+    @staticmethod
+    def is_full_api_body(post: dict, soup: BeautifulSoup) -> bool:
+        """
+        Returns True if the body of a paid post from the API is the whole post rather than its free preview, judged
+        by the API's wordcount. Without a wordcount the body cannot be confirmed, so it counts as a preview.
+        """
+        try:
+            wordcount = int(post.get("wordcount") or 0)
+        except (TypeError, ValueError):
+            return False
+        if wordcount <= 0:
+            return False
+        body = POST_CONTENT_SELECTOR.select_one(soup)
+        body_words = len(body.get_text(" ").split()) if body else 0
+        return body_words >= wordcount * POST_API_MIN_WORD_RATIO
+
     def get_url_soup(self, url: str) -> BeautifulSoup:
         """
-        Gets soup from URL using logged in selenium driver
+        Gets soup from URL, through the post API if it returns the full post, otherwise using a logged in selenium
+        driver
         """
+        soup = self.get_api_soup(url)
+        if soup is not None:
+            return soup
+
         try:
-            print(f"Loading premium content from: {url}")
-            self.driver.get(url)
-            
-            # Wait for the page to load
-            sleep(1)
+            # A driver is not thread-safe: posts are scraped concurrently, but each browser serves one at a time
+            self.driver = self._driver_pool.get()
+            try:
+                self.rate_limiter.wait()
+                print(f"Loading premium content from: {url}")
+                try:
+                    self.driver.get(url)
+                except InvalidSessionIdException:
+                    if not self._owns_driver:
+                        raise
+                    # Restart once; if the new browser fails too, the error propagates
+                    self.restart_driver()
+                    self.driver.get(url)
+                
+                # Wait for the page to load
+                self.wait_for_post_content()
 
-            self.click_login_if_needed()
-            
-            # Additional wait to ensure content is fully loaded
-            sleep(1)
+                self.click_login_if_needed()
+                
+                # Wait again in case the login click reloaded the page
+                self.wait_for_post_content()
+
+                page_source = self.driver.page_source
+            finally:
+                # After a restart this is the new browser
+                self._driver_pool.put(self.driver)
+                self.driver = None
             
-            soup = BeautifulSoup(self.driver.page_source, "html.parser")
+            soup = self.make_soup(page_source)
             
             return soup
         except Exception as e:
@@ -1316,6 +2500,38 @@ def parse_args() -> argparse.Namespace:
         help="Optional: Specify a custom user agent for selenium browser automation. Useful for "
         "passing captcha in headless mode",
     )
+    parser.add_argument(
+        "--browsers",
+        type=int,
+        default=1,
+        help="Optional: The number of browsers the Premium Substack Scraper loads posts with in parallel. Each "
+        "browser logs in separately.",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=None,
+        help=f"Optional: The number of posts scraped in parallel. Defaults to {MAX_CONCURRENT_HTTP_POSTS}, or "
+        f"{MAX_CONCURRENT_POSTS} with the Premium Substack Scraper.",
+    )
+    parser.add_argument(
+        "--io-pool-size",
+        type=int,
+        default=MAX_CONCURRENT_IMAGES,
+        help="Optional: The number of images downloaded in parallel, shared by all posts.",
+    )
+    parser.add_argument(
+        "--rate-limit",
+        type=float,
+        default=0.0,
+        help="Optional: The maximum number of post pages loaded per second. If 0 or not provided, there is no limit.",
+    )
+    parser.add_argument(
+        "--legacy-markdown",
+        action="store_true",
+        help="Optional: Convert posts to Markdown with html2text, as older versions did, instead of the built-in "
+        "converter.",
+    )
     parser.add_argument(
         "--html-directory",
         type=str,
@@ -1343,15 +2559,27 @@ def main():
                 html_save_dir=args.html_directory,
                 chrome_path=args.chrome_path,
                 chrome_driver_path=args.chrome_driver_path,
-                user_agent=args.user_agent
+                user_agent=args.user_agent,
+                browsers=args.browsers,
+                concurrency=args.concurrency,
+                image_concurrency=args.io_pool_size,
+                rate_limit=args.rate_limit,
+                legacy_markdown=args.legacy_markdown
             )
         else:
             scraper = SubstackScraper(
                 args.url,
                 md_save_dir=args.directory,
-                html_save_dir=args.html_directory
+                html_save_dir=args.html_directory,
+                concurrency=args.concurrency,
+                image_concurrency=args.io_pool_size,
+                rate_limit=args.rate_limit,
+                legacy_markdown=args.legacy_markdown
             )
-        scraper.scrape_posts(args.number)
+        try:
+            scraper.scrape_posts(args.number)
+        finally:
+            scraper.close()
 
     else:  # Use the hardcoded values at the top of the file
         if USE_PREMIUM or args.premium:
@@ -1361,15 +2589,27 @@ def main():
                 html_save_dir=args.html_directory,
                 chrome_path=args.chrome_path,
                 chrome_driver_path=args.chrome_driver_path,
-                user_agent=args.user_agent
+                user_agent=args.user_agent,
+                browsers=args.browsers,
+                concurrency=args.concurrency,
+                image_concurrency=args.io_pool_size,
+                rate_limit=args.rate_limit,
+                legacy_markdown=args.legacy_markdown
             )
         else:
             scraper = SubstackScraper(
                 base_substack_url=BASE_SUBSTACK_URL,
                 md_save_dir=args.directory,
-                html_save_dir=args.html_directory
+                html_save_dir=args.html_directory,
+                concurrency=args.concurrency,
+                image_concurrency=args.io_pool_size,
+                rate_limit=args.rate_limit,
+                legacy_markdown=args.legacy_markdown
             )
-        scraper.scrape_posts(num_posts_to_scrape=NUM_POSTS_TO_SCRAPE)
+        try:
+            scraper.scrape_posts(num_posts_to_scrape=NUM_POSTS_TO_SCRAPE)
+        finally:
+            scraper.close()
 
 
 if __name__ == "__main__":
@@ -4,74 +4,193 @@ Test script for remote Substack scraper connection
 This script tests SSH access to the miniPC server
 """
 
+import argparse
+import functools
+import json
+import socket
 import subprocess
 import sys
+import time
 from pathlib import Path
 
-def test_connection():
-    """Test SSH connection to miniPC"""
-    print("Testing connection to miniPC server...")
-    print(f"Target: ubuntu@192.168.104.209")
-    
+from config import REMOTE_SERVER, REMOTE_USER, REMOTE_BASE_DIR, SSH_KEY_PATH
+
+REMOTE_TARGET = f"{REMOTE_USER}@{REMOTE_SERVER}"
+
+# Options for the probe, which runs the same ssh the scraper falls back to, so it honours ~/.ssh/config, the agent and
+# known_hosts as the scraper's ssh commands do. It leaves a ControlMaster behind for a minute on the scraper's control
+# path, so reruns and a scraper run straight afterwards reuse its connection; auth goes straight to the configured key
+# and fails instead of prompting, and a dead connection is given up on after two missed keepalives.
+SSH_OPTS = [
+    "-T",
+    "-i", SSH_KEY_PATH,
+    "-o", "StrictHostKeyChecking=no",
+    "-o", "ConnectTimeout=10",
+    "-o", "ControlMaster=auto",
+    "-o", "ControlPath=~/.ssh/control-%r@%h:%p",
+    "-o", "ControlPersist=60",
+    "-o", "PreferredAuthentications=publickey",
+    "-o", "GSSAPIAuthentication=no",
+    "-o", "IdentitiesOnly=yes",
+    "-o", "BatchMode=yes",
+    "-o", "ServerAliveInterval=15",
+    "-o", "ServerAliveCountMax=2",
+]
+
+# The probe first checks that the SSH port answers within PORT_CHECK_TIMEOUT seconds, so a host that is down fails
+# fast instead of waiting out ConnectTimeout. The host and port are resolved through ~/.ssh/config with `ssh -G`;
+# behind a ProxyJump or ProxyCommand the port is not reachable directly, so the check is skipped.
+PORT_CHECK_TIMEOUT = 3
+
+# Failures whose error text contains one of these are retried up to PROBE_ATTEMPTS times, waiting RETRY_BASE_DELAY
+# seconds and doubling; anything else (auth denied, missing directory) is reported straight away
+TRANSIENT_ERRORS = (
+    "Connection reset", "Connection closed", "timed out", "Error reading SSH protocol banner", "unreachable"
+)
+PROBE_ATTEMPTS = 3
+RETRY_BASE_DELAY = 0.5
+
+# Separates the connection test's output from the directory listing in the probe's stdout
+DIRECTORY_MARKER = "__S2MD_DIRECTORY__"
+
+# The remote commands behind both tests; the listing comes last so the session's exit status is its own
+PROBE_COMMAND = f"echo 'Connection successful'; echo {DIRECTORY_MARKER}; ls -la {REMOTE_BASE_DIR}"
+
+# Without --verbose the listing is discarded on the server, so only its exit status and errors travel back
+QUIET_PROBE_COMMAND = f"{PROBE_COMMAND} > /dev/null"
+
+# Verdicts of recent runs, keyed by user@host; a pass newer than PROBE_CACHE_TTL seconds skips SSH entirely
+PROBE_CACHE = Path.home() / ".cache" / "substack2md" / "remote_probe.json"
+PROBE_CACHE_TTL = 300
+
+
+def _load_cache():
+    """Read the cached verdicts; a missing or unreadable cache file counts as empty"""
     try:
-        result = subprocess.run([
-            "ssh", 
-            "-o", "StrictHostKeyChecking=no",
-            "-o", "ConnectTimeout=10",
-            "ubuntu@192.168.104.209",
-            "echo 'Connection successful'"
-        ], capture_output=True, text=True, timeout=30)
-        
-        if result.returncode == 0:
-            print("✓ Successfully connected to miniPC server")
-            print(f"Response: {result.stdout.strip()}")
-            return True
-        else:
-            print(f"✗ Connection failed: {result.stderr}")
-            return False
+        return json.loads(PROBE_CACHE.read_text())
+    except (OSError, ValueError):
+        return {}
+
+def _store_cache(verdict):
+    """Record whether REMOTE_TARGET passed all tests just now"""
+    cache = _load_cache()
+    cache[REMOTE_TARGET] = {"ok": verdict, "checked_at": time.time()}
+    try:
+        PROBE_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        PROBE_CACHE.write_text(json.dumps(cache))
+    except OSError:
+        pass  # The cache is only an optimisation
+
+def cached_pass():
+    """Return True if REMOTE_TARGET passed all tests within the last PROBE_CACHE_TTL seconds"""
+    entry = _load_cache().get(REMOTE_TARGET)
+    return isinstance(entry, dict) and entry.get("ok") is True and time.time() - entry.get("checked_at", 0) < PROBE_CACHE_TTL
+
+@functools.lru_cache(maxsize=1)
+def _ssh_endpoint():
+    """Return the (host, port) ssh connects to for REMOTE_TARGET, or None if it goes through a proxy or is unknown"""
+    try:
+        result = subprocess.run(
+            ["ssh", "-G", *SSH_OPTS, REMOTE_TARGET], capture_output=True, text=True, timeout=10
+        )
+    except (subprocess.TimeoutExpired, OSError):
+        return None
+    if result.returncode != 0:
+        return None
+
+    config = dict(line.split(" ", 1) for line in result.stdout.splitlines() if " " in line)
+    if config.get("proxyjump", "none") != "none" or config.get("proxycommand", "none") != "none":
+        return None
+    try:
+        return config["hostname"], int(config["port"])
+    except (KeyError, ValueError):
+        return None
+
+def _probe_once(command):
+    """Run both remote checks in a single SSH session; returns the CompletedProcess, or an error message"""
+    endpoint = _ssh_endpoint()
+    if endpoint is not None:
+        try:
+            socket.create_connection(endpoint, timeout=PORT_CHECK_TIMEOUT).close()
+        except OSError as e:
+            return f"Port {endpoint[1]} on {endpoint[0]} unreachable: {e}"
+
+    try:
+        return subprocess.run(
+            ["ssh", *SSH_OPTS, REMOTE_TARGET, command], capture_output=True, text=True, timeout=30
+        )
     except subprocess.TimeoutExpired:
-        print("✗ Connection timed out")
-        return False
+        return "Connection timed out"
     except Exception as e:
-        print(f"✗ Connection error: {e}")
+        return f"Connection error: {e}"
+
+def _is_transient(probe):
+    """Return True if the probe failed in a way that is worth retrying"""
+    if isinstance(probe, str):
+        error = probe
+    elif probe.returncode == 255:
+        error = probe.stderr  # ssh's own failures exit with 255; other codes come from the remote commands
+    else:
+        return False
+    return any(marker in error for marker in TRANSIENT_ERRORS)
+
+def run_remote_probe(command):
+    """Run the probe, retrying transient connection failures with exponential backoff"""
+    for attempt in range(PROBE_ATTEMPTS):
+        probe = _probe_once(command)
+        if attempt == PROBE_ATTEMPTS - 1 or not _is_transient(probe):
+            return probe
+        delay = RETRY_BASE_DELAY * 2 ** attempt
+        print(f"Transient connection failure, retrying in {delay:g}s...")
+        time.sleep(delay)
+
+def check_connection(probe):
+    """Test SSH connection to miniPC"""
+    print("Testing connection to miniPC server...")
+    print(f"Target: {REMOTE_TARGET}")
+
+    if isinstance(probe, str):
+        print(f"✗ {probe}")
+        return False
+
+    # The marker is only printed once the remote shell runs, whatever happens to the directory listing
+    response, marker, _ = probe.stdout.partition(DIRECTORY_MARKER)
+    if marker:
+        print("✓ Successfully connected to miniPC server")
+        print(f"Response: {response.strip()}")
+        return True
+    else:
+        print(f"✗ Connection failed: {probe.stderr}")
         return False
 
-def test_remote_directories():
+def check_remote_directories(probe, verbose=False):
     """Test if remote directories exist and are accessible"""
     print("\nTesting remote directory access...")
-    
-    try:
-        result = subprocess.run([
-            "ssh",
-            "-o", "StrictHostKeyChecking=no",
-            "-o", "ConnectTimeout=10",
-            "ubuntu@192.168.104.209",
-            "ls -la /home/ubuntu/substacks"
-        ], capture_output=True, text=True, timeout=30)
-        
-        if result.returncode == 0:
-            print("✓ Remote substacks directory is accessible")
+
+    # The listing is the last command, so the session's exit status is the listing's
+    if probe.returncode == 0:
+        print("✓ Remote substacks directory is accessible")
+        if verbose:
             print("Directory contents:")
-            print(result.stdout)
-            return True
-        else:
-            print(f"✗ Remote directory access failed: {result.stderr}")
-            return False
-    except Exception as e:
-        print(f"✗ Directory test error: {e}")
+            print(probe.stdout.partition(DIRECTORY_MARKER)[2].lstrip("\n"))
+        return True
+    else:
+        print(f"✗ Remote directory access failed: {probe.stderr}")
         return False
 
-def main():
-    print("Substack Remote Scraper Connection Test")
-    print("=" * 50)
-    
+def run_tests(verbose=False):
+    probe = run_remote_probe(PROBE_COMMAND if verbose else QUIET_PROBE_COMMAND)
+
     # Test basic connection
-    connection_ok = test_connection()
-    
+    connection_ok = check_connection(probe)
+
     if connection_ok:
         # Test directory access
-        directory_ok = test_remote_directories()
-        
+        directory_ok = check_remote_directories(probe, verbose)
+
+        # Only a full pass is trusted by later runs, so a failure clears the cached verdict
+        _store_cache(directory_ok)
+
         if directory_ok:
             print("\n✓ All tests passed! The scraper should work correctly.")
             sys.exit(0)
@@ -80,12 +199,38 @@ def main():
             print("The scraper will fall back to local storage.")
             sys.exit(1)
     else:
+        _store_cache(False)
         print("\n✗ Connection test failed.")
         print("Please ensure:")
-        print("1. The miniPC server is running at 192.168.104.209")
+        print(f"1. The miniPC server is running at {REMOTE_SERVER}")
         print("2. SSH is enabled and accessible")
         print("3. Your SSH key is properly configured")
         sys.exit(1)
 
+def main():
+    parser = argparse.ArgumentParser(description="Test SSH access to the remote server.")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Probe the server even if it passed all tests in the last {PROBE_CACHE_TTL // 60} minutes.",
+    )
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        action="store_true",
+        help="Print the contents of the remote substacks directory.",
+    )
+    args = parser.parse_args()
+
+    print("Substack Remote Scraper Connection Test")
+    print("=" * 50)
+
+    if not args.no_cache and cached_pass():
+        print(f"✓ {REMOTE_TARGET} passed all tests in the last {PROBE_CACHE_TTL // 60} minutes (cached)")
+        print("Run with --no-cache to probe it again.")
+        sys.exit(0)
+
+    run_tests(args.verbose)
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Regression check for the built-in HTML to Markdown converter. Each case converts a post fragment with
+element_to_markdown, compares the output with the expected Markdown, and renders it back with Python-Markdown to
+check it keeps the fragment's structure. Run it after changing the converter:
+
+    python tools/check_markdown.py
+"""
+
+import os
+import sys
+
+import markdown
+from bs4 import BeautifulSoup
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from substack_scraper import element_to_markdown  # noqa: E402
+
+# (post HTML, expected Markdown, expected HTML once the Markdown is rendered)
+CASES = (
+    # Paragraph text that looks like block syntax stays a paragraph
+    ("<p>- dash start</p>", "\\- dash start", "<p>- dash start</p>"),
+    ("<p>+ plus</p>", "\\+ plus", "<p>+ plus</p>"),
+    ("<p>* star</p>", "\\* star", "<p>* star</p>"),
+    ("<p>2024. What a year</p>", "2024\\. What a year", "<p>2024. What a year</p>"),
+    ("<p># 1 priority</p>", "\\# 1 priority", "<p># 1 priority</p>"),
+    ("<p>&gt; not a quote</p>", "\\> not a quote", "<p>&gt; not a quote</p>"),
+    ("<p>first<br>- second</p>", "first  \n\\- second", "<p>first<br />\n- second</p>"),
+    # Inline characters in text are literal
+    ("<p>snake_case and 2*3 [sic] `tick`</p>", "snake\\_case and 2\\*3 \\[sic\\] \\`tick\\`",
+     "<p>snake_case and 2*3 [sic] `tick`</p>"),
+    # Emphasis inside a word
+    ("<p>word<em>em</em>tail</p>", "word*em*tail", "<p>word<em>em</em>tail</p>"),
+    ("<p>word<strong>bold</strong>tail</p>", "word**bold**tail", "<p>word<strong>bold</strong>tail</p>"),
+    # Markup the converter writes itself is not escaped
+    ("<p><strong>Bold</strong> start</p>", "**Bold** start", "<p><strong>Bold</strong> start</p>"),
+    ('<p><a href="https://example.com">a_link</a></p>', "[a\\_link](https://example.com)",
+     '<p><a href="https://example.com">a_link</a></p>'),
+    # Code keeps its text verbatim
+    ("<p><code>a_b*c</code></p>", "`a_b*c`", "<p><code>a_b*c</code></p>"),
+    # Backticks inside inline code get a longer fence, padded when they sit at either end
+    ("<p><code>a`b</code></p>", "``a`b``", "<p><code>a`b</code></p>"),
+    ("<p><code>`tick`</code></p>", "`` `tick` ``", "<p><code>`tick`</code></p>"),
+    ("<p><code>x``y</code></p>", "```x``y```", "<p><code>x``y</code></p>"),
+    ("<pre>- item\n# not a heading</pre>", "```\n- item\n# not a heading\n```", None),
+    # Real lists and headings still come out as such
+    ("<ul><li>- one</li><li>two</li></ul>", "* \\- one\n* two", "<ul>\n<li>- one</li>\n<li>two</li>\n</ul>"),
+    ("<h2>1. Intro</h2>", "## 1\\. Intro", "<h2>1. Intro</h2>"),
+)
+
+
+def main() -> int:
+    failures = 0
+    for html, expected_md, expected_html in CASES:
+        soup = BeautifulSoup(f"<div>{html}</div>", "lxml")
+        md = element_to_markdown(soup.div).rstrip("\n")
+        rendered = markdown.markdown(md)
+        if md != expected_md:
+            failures += 1
+            print(f"✗ {html!r}\n    markdown: {md!r}\n    expected: {expected_md!r}")
+        elif expected_html is not None and rendered != expected_html:
+            failures += 1
+            print(f"✗ {html!r}\n    rendered: {rendered!r}\n    expected: {expected_html!r}")
+
+    if failures:
+        print(f"\n{failures} of {len(CASES)} cases failed")
+        return 1
+    print(f"✓ All {len(CASES)} cases passed")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
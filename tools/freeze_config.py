@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Freeze the .env file into config_frozen.py, a plain constants module that config.py imports instead of parsing
+.env at runtime. Run this at build/deploy time whenever .env changes:
+
+    python tools/freeze_config.py [path/to/.env]
+"""
+
+import os
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+import config  # noqa: E402
+
+FROZEN_PATH = os.path.join(ROOT_DIR, "config_frozen.py")
+
+
+def freeze(env_path: str) -> str:
+    """
+    Write the known settings found in env_path to config_frozen.py and return its path
+    """
+    values = config._parse_env(env_path, os.path.getsize(env_path))
+
+    lines = [
+        '"""Generated by tools/freeze_config.py from .env. Do not edit or commit."""',
+        "",
+        "from typing import Final",
+        "",
+    ]
+    for name in config._SETTING_NAMES:
+        if name in values:
+            lines.append(f"{name}: Final[str] = {values[name]!r}")
+
+    # The file holds credentials, so keep it readable only by the current user
+    fd = os.open(FROZEN_PATH, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w", encoding="utf-8") as file:
+        file.write("\n".join(lines) + "\n")
+    return FROZEN_PATH
+
+
+def main():
+    env_path = sys.argv[1] if len(sys.argv) > 1 else config._ENV_PATH
+    if not os.path.exists(env_path):
+        print(f"✗ No .env file found at {env_path}")
+        sys.exit(1)
+
+    print(f"✓ Wrote {freeze(env_path)}")
+
+
+if __name__ == "__main__":
+    main()